@@ -81,11 +81,10 @@ class BlueprintInterpreter:
             # Process AI Result
             if llm_result.get("success"):
                 try:
-                    analysis_str = llm_result.get("analysis", "{}")
-                    if "```" in analysis_str:
-                         analysis_str = analysis_str.replace("```json", "").replace("```", "")
-                    
-                    ai_data = json.loads(analysis_str)
+                    # LLMClient already strips fences and parses the JSON reply
+                    ai_data = llm_result.get("data")
+                    if ai_data is None:
+                        ai_data = json.loads(llm_result.get("analysis", "{}"))
                     
                     # Merge logic
                     if not metadata['scale'] and ai_data.get('scale'):
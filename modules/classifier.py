@@ -21,6 +21,11 @@ import logging
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
+try:  # pragma: no cover - optional dependency (ships with scikit-learn)
+    import joblib
+except ImportError:
+    joblib = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,8 +53,13 @@ class DocumentClassifier:
             p = Path(model_path)
             if p.exists():
                 try:
-                    with open(p, "rb") as f:
-                        self.model = pickle.load(f)
+                    if joblib is not None:
+                        from .learning import ModelTrainer
+
+                        self.model = ModelTrainer.load_model(p)
+                    else:
+                        with open(p, "rb") as f:
+                            self.model = pickle.load(f)
                     logger.info(f"Loaded AI Classifier from {p}")
                 except Exception as e:
                     logger.error(f"Failed to load AI Classifier: {e}")
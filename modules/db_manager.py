@@ -14,7 +14,7 @@ import os
 import threading
 import queue
 from contextlib import contextmanager
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:  # pragma: no cover - standard library
     import sqlite3
@@ -645,6 +645,23 @@ class DBManager:
             conn.commit()
             return int(log_id)
 
+    def insert_logs(self, entries: Iterable[Tuple[str, str, Optional[str], str]]) -> int:
+        """
+        Insert several log entries in a single transaction.
+
+        ``entries`` are ``(iso_datetime, event, detail, level)`` tuples.
+        Returns the number of rows written.
+        """
+        rows = list(entries)
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            cursor = self.get_cursor(conn)
+            sql = f"INSERT INTO logs (datetime, event, detail, level) VALUES ({self.placeholder}, {self.placeholder}, {self.placeholder}, {self.placeholder})"
+            cursor.executemany(sql, rows)
+            conn.commit()
+            return len(rows)
+
     def get_recent_logs(self, limit: int = 100) -> list:
         """Get recent log entries for monitoring."""
         with self.get_connection() as conn:
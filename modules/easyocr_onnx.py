@@ -0,0 +1,209 @@
+"""ONNX Runtime backend for EasyOCR readers.
+
+EasyOCR runs its CRAFT detector and CRNN recogniser through PyTorch in
+FP32.  This module exports both networks to ONNX once and swaps them on an
+existing :class:`easyocr.Reader` for ONNX Runtime sessions (TensorRT FP16 or
+CUDA providers), so ``readtext``/``readtext_batched`` keep their usual
+pre/post-processing and return format.  On CPU the recogniser can also be
+quantised to INT8 (static, entropy-calibrated on user-supplied samples),
+which suits the VNNI/dot-product integer paths of current CPUs.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from PIL import Image
+
+from .paddle_models import create_onnx_session
+
+try:  # pragma: no cover - optional dependency
+    import torch
+except ImportError:  # pragma: no cover - optional dependency
+    torch = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    from onnxruntime import quantization as ort_quant
+except ImportError:  # pragma: no cover - optional dependency
+    ort_quant = None  # type: ignore[assignment]
+
+
+DETECTOR_FILE = "craft_detector.onnx"
+RECOGNIZER_FILE = "crnn_recognizer.onnx"
+RECOGNIZER_INT8_FILE = "crnn_recognizer.int8.onnx"
+_OPSET = 17
+# EasyOCR feeds the recogniser 64 px high grayscale line crops scaled to [-1, 1].
+_REC_HEIGHT = 64
+_REC_MAX_WIDTH = 800
+_CALIBRATION_IMAGES = 100
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"}
+
+
+class _OrtModule:
+    """Stand-in for an EasyOCR ``nn.Module`` that runs an ONNX Runtime session.
+
+    EasyOCR calls its networks with CPU/GPU tensors and post-processes the
+    outputs with torch ops, so inputs are handed to ONNX Runtime as NumPy
+    and outputs come back as (CPU) tensors.  Extra positional arguments —
+    the recogniser's ``text`` placeholder, unused by its CTC head — are
+    ignored.
+    """
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+        self._input = session.get_inputs()[0].name
+
+    def __call__(self, x: Any, *_unused: Any) -> Any:
+        outputs = self.session.run(None, {self._input: x.detach().cpu().numpy()})
+        tensors = [torch.from_numpy(out) for out in outputs]
+        return tensors[0] if len(tensors) == 1 else tuple(tensors)
+
+    # EasyOCR occasionally toggles/moves its networks; both are no-ops here.
+    def eval(self) -> "_OrtModule":
+        return self
+
+    def to(self, *_args: Any, **_kwargs: Any) -> "_OrtModule":
+        return self
+
+
+def export_easyocr_onnx(reader: Any, out_dir: str) -> Tuple[str, str]:
+    """Export ``reader``'s detector and recogniser to ``out_dir``; returns both paths.
+
+    Batch, height and width are exported as dynamic axes so the sessions
+    accept the page and line-crop sizes EasyOCR produces.
+    """
+    if torch is None:
+        raise ImportError("torch is required to export EasyOCR models to ONNX.")
+    target = Path(out_dir)
+    target.mkdir(parents=True, exist_ok=True)
+    detector_path = target / DETECTOR_FILE
+    recognizer_path = target / RECOGNIZER_FILE
+
+    # Export CPU copies so the reader's own (possibly GPU) networks stay untouched.
+    detector = copy.deepcopy(getattr(reader.detector, "module", reader.detector)).float().cpu().eval()
+    crnn = copy.deepcopy(getattr(reader.recognizer, "module", reader.recognizer)).float().cpu().eval()
+
+    class _Recognizer(torch.nn.Module):
+        """Single-input view of the CRNN (its ``text`` argument is unused by CTC decoding)."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.crnn = crnn
+
+        def forward(self, image: Any) -> Any:
+            return self.crnn(image, None)
+
+    recognizer = _Recognizer().eval()
+    with torch.inference_mode():
+        torch.onnx.export(
+            detector,
+            torch.zeros(1, 3, 640, 640),
+            str(detector_path),
+            input_names=["image"],
+            output_names=["score", "feature"],
+            dynamic_axes={"image": {0: "batch", 2: "height", 3: "width"},
+                          "score": {0: "batch", 1: "height", 2: "width"},
+                          "feature": {0: "batch", 2: "height", 3: "width"}},
+            opset_version=_OPSET,
+        )
+        torch.onnx.export(
+            recognizer,
+            (torch.zeros(1, 1, _REC_HEIGHT, 256),),
+            str(recognizer_path),
+            input_names=["image"],
+            output_names=["preds"],
+            dynamic_axes={"image": {0: "batch", 3: "width"}, "preds": {0: "batch", 1: "steps"}},
+            opset_version=_OPSET,
+        )
+    logger.info("📦 Exported EasyOCR models to ONNX in {}", target)
+    return str(detector_path), str(recognizer_path)
+
+
+class _RecognizerCalibration:
+    """``CalibrationDataReader`` over sample images, shaped like EasyOCR line crops."""
+
+    def __init__(self, input_name: str, calibration_dir: str, limit: int = _CALIBRATION_IMAGES) -> None:
+        self.input_name = input_name
+        paths = sorted(p for p in Path(calibration_dir).iterdir() if p.suffix.lower() in _IMAGE_SUFFIXES)
+        if not paths:
+            raise FileNotFoundError(f"No calibration images found in {calibration_dir}")
+        self._paths = iter(paths[:limit])
+
+    def get_next(self) -> Any:
+        path = next(self._paths, None)
+        if path is None:
+            return None
+        with Image.open(path) as image:
+            gray = image.convert("L")
+            width = max(_REC_HEIGHT, min(_REC_MAX_WIDTH, round(gray.width * _REC_HEIGHT / max(gray.height, 1))))
+            gray = gray.resize((width, _REC_HEIGHT), Image.BICUBIC)
+        array = (np.asarray(gray, dtype=np.float32) / 255.0 - 0.5) / 0.5
+        return {self.input_name: array[None, None, :, :]}
+
+
+def quantize_recognizer_int8(model_path: str, calibration_dir: str, out_path: str) -> str:
+    """Statically quantise the exported recogniser to INT8 (QDQ, entropy calibration)."""
+    if ort_quant is None:
+        raise ImportError("onnxruntime.quantization is not available.")
+    input_name = create_onnx_session(model_path).get_inputs()[0].name
+    ort_quant.quantize_static(
+        model_path,
+        out_path,
+        _RecognizerCalibration(input_name, calibration_dir),
+        quant_format=ort_quant.QuantFormat.QDQ,
+        # U8 activations with S8 weights map onto the integer dot-product instructions.
+        activation_type=ort_quant.QuantType.QUInt8,
+        weight_type=ort_quant.QuantType.QInt8,
+        calibrate_method=ort_quant.CalibrationMethod.Entropy,
+    )
+    logger.info("🗜️ Quantised EasyOCR recogniser to INT8: {}", out_path)
+    return out_path
+
+
+def attach_onnx_backend(
+    reader: Any,
+    onnx_dir: str = os.path.join("models", "easyocr_onnx"),
+    device_id: int = 0,
+    tensorrt: bool = False,
+    int8: bool = False,
+    calibration_dir: Optional[str] = None,
+) -> Any:
+    """Run ``reader``'s networks through ONNX Runtime, exporting them first if needed.
+
+    With ``int8`` the recogniser is loaded from its INT8 export, quantising it
+    first from ``calibration_dir`` when no INT8 model is cached yet; without
+    either, the FP32 recogniser is kept and a warning is logged.
+    """
+    detector_path = os.path.join(onnx_dir, DETECTOR_FILE)
+    recognizer_path = os.path.join(onnx_dir, RECOGNIZER_FILE)
+    if not (os.path.exists(detector_path) and os.path.exists(recognizer_path)):
+        detector_path, recognizer_path = export_easyocr_onnx(reader, onnx_dir)
+    if int8:
+        int8_path = os.path.join(onnx_dir, RECOGNIZER_INT8_FILE)
+        if not os.path.exists(int8_path) and calibration_dir:
+            quantize_recognizer_int8(recognizer_path, calibration_dir, int8_path)
+        if os.path.exists(int8_path):
+            recognizer_path = int8_path
+        else:
+            logger.warning("⚠️ No INT8 recogniser in {} and no calibration_dir; using FP32.", onnx_dir)
+
+    # Sessions are built before touching the reader, so a failure leaves the
+    # PyTorch networks in place.  Pages reach the detector padded to a few
+    # repeated shapes, worth an exhaustive cuDNN search; line crops reach the
+    # recogniser at a new width almost every batch, so it uses the heuristic.
+    detector = _OrtModule(create_onnx_session(detector_path, device_id, tensorrt=tensorrt))
+    recognizer = _OrtModule(
+        create_onnx_session(recognizer_path, device_id, tensorrt=tensorrt, conv_algo_search="HEURISTIC")
+    )
+    reader.detector = detector
+    reader.recognizer = recognizer
+    logger.info("⚡ EasyOCR running on ONNX Runtime (tensorrt={}, recogniser={})", tensorrt, os.path.basename(recognizer_path))
+    return reader
+
+
+__all__ = ["attach_onnx_backend", "export_easyocr_onnx", "quantize_recognizer_int8"]
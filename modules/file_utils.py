@@ -16,6 +16,11 @@ import os
 import shutil
 from typing import Iterable, List, Optional
 
+try:  # pragma: no cover - optional dependency
+    import xxhash
+except ImportError:
+    xxhash = None
+
 
 def ensure_directories(*paths: str) -> None:
     """
@@ -48,14 +53,19 @@ def list_scannable_files(input_folder: str, file_types: Iterable[str]) -> List[s
 
 def compute_hash(file_path: str, algorithm: str = "md5", block_size: int = 65536) -> str:
     """
-    Compute a cryptographic hash of the file's contents.  Supported
-    algorithms include ``md5`` and ``sha256``.  Larger block sizes may
-    improve performance on very large files.
+    Compute a hash of the file's contents.  Supported algorithms include
+    ``md5``, ``sha256``, ``blake2b`` and, when the ``xxhash`` package is
+    installed, the non-cryptographic ``xxh3`` (suitable for cache keys).
+    Larger block sizes may improve performance on very large files.
     """
     if algorithm.lower() == "md5":
         hasher = hashlib.md5()
     elif algorithm.lower() in ("sha256", "sha-256"):
         hasher = hashlib.sha256()
+    elif algorithm.lower() == "blake2b":
+        hasher = hashlib.blake2b(digest_size=16)
+    elif algorithm.lower() == "xxh3" and xxhash is not None:
+        hasher = xxhash.xxh3_128()
     else:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}")
     with open(file_path, "rb") as f:
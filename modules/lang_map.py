@@ -8,7 +8,8 @@ all components remain consistent.
 
 from __future__ import annotations
 
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 
 LANG_MAP = {
@@ -22,6 +23,7 @@ LANG_MAP = {
 }
 
 
+@lru_cache(maxsize=64)
 def map_code(code: str) -> str:
     """Return the engine-compatible code for ``code``."""
     normalised = (code or "").strip().lower()
@@ -34,7 +36,15 @@ def map_codes(codes: Iterable[str] | None) -> List[str]:
     """
     if not codes:
         return ["en"]
-    return [map_code(code) for code in codes]
+    if not isinstance(codes, tuple):
+        codes = tuple(codes)
+    # Return a fresh list so callers cannot mutate the cached result.
+    return list(_map_codes_cached(codes))
+
+
+@lru_cache(maxsize=64)
+def _map_codes_cached(codes: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(map_code(code) for code in codes)
 
 
 __all__ = ["LANG_MAP", "map_code", "map_codes"]
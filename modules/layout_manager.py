@@ -11,9 +11,11 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, TypedDict
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, TypedDict
 
+import cv2
 import numpy as np
 from PIL import Image
 
@@ -23,9 +25,10 @@ from .paddle_singleton import get_ppstructure_v3_instance
 os.environ.setdefault("PADDLEOCR_DISABLE_VLM", "1")
 
 try:
-    from pdf2image import convert_from_path  # type: ignore
+    from pdf2image import convert_from_path, pdfinfo_from_path  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
     convert_from_path = None  # type: ignore
+    pdfinfo_from_path = None  # type: ignore
 
 
 class LayoutBlock(TypedDict):
@@ -98,11 +101,13 @@ class LayoutManager:
         list[LayoutBlock]
             Normalised list of blocks with bounding boxes and metadata.
         """
-        page_images = list(pages) if pages is not None else self._load_document_images(image_or_pdf_path)
+        page_images: Iterable[Image.Image] = (
+            pages if pages is not None else self._load_document_images(image_or_pdf_path)
+        )
         blocks: List[LayoutBlock] = []
 
-        for page_index, page_image in enumerate(page_images):
-            if self._engine is None:
+        for page_index, (page_image, page_array) in enumerate(self._iter_page_arrays(page_images)):
+            if page_array is None:
                 width, height = page_image.size
                 blocks.append(
                     LayoutBlock(
@@ -115,7 +120,6 @@ class LayoutManager:
                 )
                 continue
 
-            page_array = self._pil_to_np(page_image)
             try:
                 results = self._engine(page_array)
             except Exception as exc:  # pragma: no cover - Paddle runtime errors
@@ -178,46 +182,78 @@ class LayoutManager:
                 exc,
             )
             self._engine = None
-            return
 
-        self._engine = engine
+    def _iter_page_arrays(
+        self, page_images: Iterable[Image.Image]
+    ) -> Iterator[Tuple[Image.Image, Optional[np.ndarray]]]:
+        """
+        Yield ``(page_image, page_array)`` pairs, preparing the next page while
+        the caller runs layout inference on the current one.
+
+        The engine is invoked one page at a time (pages differ in size so they
+        cannot be stacked), so rasterisation and BGR conversion of page ``n+1``
+        are overlapped with inference on page ``n`` instead. ``page_array`` is
+        ``None`` when no engine is available.
+        """
+        iterator = iter(page_images)
+        engine_available = self._engine is not None
+
+        def _prepare() -> Optional[Tuple[Image.Image, Optional[np.ndarray]]]:
+            page = next(iterator, None)
+            if page is None:
+                return None
+            return page, (self._pil_to_np(page) if engine_available else None)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="layout-prefetch") as executor:
+            pending = executor.submit(_prepare)
+            while True:
+                prepared = pending.result()
+                if prepared is None:
+                    return
+                pending = executor.submit(_prepare)
+                yield prepared
+
+    def _load_document_images(self, path: str) -> Iterator[Image.Image]:
+        """
+        Yield the pages of ``path`` one at a time as RGB images.
 
-    def _load_document_images(self, path: str) -> List[Image.Image]:
+        PDFs are rasterised page by page so only the page currently being
+        analysed is held in memory.
+        """
         ext = os.path.splitext(path)[1].lower()
         if ext == ".pdf":
             if convert_from_path is None:
                 raise RuntimeError(
                     "pdf2image is required for PDF layout detection but is not installed"
                 )
-            pages = convert_from_path(path)
-            return [page.convert("RGB") for page in pages]
+            page_count = int(pdfinfo_from_path(path).get("Pages", 0))
+            for page_number in range(1, page_count + 1):
+                rendered = convert_from_path(path, first_page=page_number, last_page=page_number)
+                for page in rendered:
+                    yield page.convert("RGB")
+            return
 
-        image = Image.open(path)
-        images = []
-        try:
-            n_frames = getattr(image, "n_frames", 1)
-        except Exception:
-            n_frames = 1
+        with Image.open(path) as image:
+            try:
+                n_frames = getattr(image, "n_frames", 1)
+            except Exception:
+                n_frames = 1
 
-        if n_frames > 1:
             for idx in range(n_frames):
-                image.seek(idx)
-                images.append(image.convert("RGB"))
-        else:
-            images.append(image.convert("RGB"))
-
-        return images
+                if n_frames > 1:
+                    image.seek(idx)
+                yield image.convert("RGB")
 
     @staticmethod
     def _pil_to_np(image: Image.Image) -> np.ndarray:
-        array = np.array(image)
+        # ``np.asarray`` avoids an extra copy; cvtColor performs the channel
+        # swap (RGB -> BGR for Paddle) and the output allocation in one pass.
+        array = np.asarray(image)
         if array.ndim == 2:
-            return np.stack([array, array, array], axis=-1)
+            return cv2.cvtColor(array, cv2.COLOR_GRAY2BGR)
         if array.shape[2] == 4:
-            # Drop alpha channel
-            array = array[:, :, :3]
-        # Convert RGB -> BGR for Paddle expectations
-        return array[:, :, ::-1].copy()
+            return cv2.cvtColor(array, cv2.COLOR_RGBA2BGR)
+        return cv2.cvtColor(array, cv2.COLOR_RGB2BGR)
 
 
 def _ensure_bbox(value: Optional[Iterable[float]]) -> List[int]:
@@ -1,10 +1,13 @@
-import pickle
 import logging
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Any, Iterator, Optional, List, Tuple, Union
+
+import numpy as np
 
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
+    import joblib
+    import scipy.sparse as sp
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
     from sklearn.linear_model import SGDClassifier
     from sklearn.pipeline import Pipeline
 except ImportError:
@@ -12,59 +15,118 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Verified documents: whatever type is stored in the DB is the ground truth
+# for non-Unknown, non-New types.
+_TRAINING_FILTER = """
+    FROM documents d
+    JOIN ocr_texts o ON d.id = o.id_doc
+    WHERE o.text IS NOT NULL
+    AND length(o.text) > 20
+    AND d.type IS NOT NULL
+    AND d.type != 'Unknown'
+"""
+
+# Rows pulled from the cursor per round trip while hashing the corpus.
+_FETCH_BATCH = 2048
+# Documents per SGD mini-batch and passes over the corpus (matches the former max_iter=5).
+_TRAIN_BATCH = 1024
+_TRAIN_EPOCHS = 5
+# Hashed feature space; fixed size, so no vocabulary is kept in memory or in the pickle.
+_HASH_FEATURES = 2 ** 18
+# Same tokens as scikit-learn's default ``\b\w\w+\b`` (Unicode word runs of two or
+# more characters) without the word-boundary assertions.
+_TOKEN_PATTERN = r"(?u)\w{2,}"
+
+
+def _iter_batches(cursor, size: int) -> Iterator[Tuple[List[str], List[str]]]:
+    """Yield ``(texts, labels)`` chunks from an executed cursor."""
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        yield [r[0] for r in rows], [r[1] for r in rows]
+
+
 class ModelTrainer:
     """Handles training of the AI classifier."""
 
-    def __init__(self, db_manager, model_path: str):
+    def __init__(self, db_manager, model_path: str, compress: Optional[Union[int, Tuple[str, int]]] = None):
         self.db = db_manager
         self.model_path = Path(model_path)
-        
+        # e.g. ('lz4', 3) for a smaller file; compressed models cannot be memory-mapped.
+        self.compress = compress
+
+    @staticmethod
+    def load_model(model_path: Union[str, Path]) -> Any:
+        """Load a pipeline saved by :meth:`train`, memory-mapping its arrays when uncompressed."""
+        return joblib.load(model_path, mmap_mode='r')
+
     def train(self) -> Tuple[bool, str]:
         """Train model using verified documents from DB."""
         if Pipeline is None:
             return False, "Scikit-learn not installed."
 
         try:
-            # Fetch data: Assuming verified docs have correct types
-            # Use 'completed' or 'verified' status if available.
-            # Here we assume whatever 'doc_type' is in the DB is the ground truth
-            # for non-Unknown, non-New types.
-            
-            cursor = self.db.conn.cursor()
-            cursor.execute("""
-                SELECT o.text, d.doc_type 
-                FROM documents d
-                JOIN ocr_texts o ON d.id = o.id_doc
-                WHERE o.text IS NOT NULL 
-                AND length(o.text) > 20
-                AND d.doc_type IS NOT NULL
-                AND d.doc_type != 'Unknown'
-            """)
-            rows = cursor.fetchall()
-            
-            if len(rows) < 5:
-                return False, f"Not enough data to train (found {len(rows)}, need 5+)."
-
-            texts = [r[0] for r in rows]
-            labels = [r[1] for r in rows]
-            
-            # Create Pipeline
-            # SGDClassifier is fast and supports incremental learning if needed later
-            pipeline = Pipeline([
-                ('tfidf', TfidfVectorizer(max_features=5000, stop_words=None)),
-                ('clf', SGDClassifier(loss='hinge', penalty='l2', alpha=1e-3, random_state=42, max_iter=5, tol=None)),
-            ])
-            
-            logger.info(f"Training on {len(texts)} documents...")
-            pipeline.fit(texts, labels)
-            
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) " + _TRAINING_FILTER)
+                n_rows = int(cursor.fetchone()[0])
+
+                if n_rows < 5:
+                    return False, f"Not enough data to train (found {n_rows}, need 5+)."
+
+                cursor.execute("SELECT DISTINCT d.type " + _TRAINING_FILTER)
+                classes = np.array(sorted(r[0] for r in cursor.fetchall()), dtype=object)
+
+                # Create Pipeline
+                # HashingVectorizer is stateless, so each fetched chunk is hashed
+                # as it arrives and the raw OCR text never accumulates in memory.
+                # SGDClassifier supports incremental learning via partial_fit;
+                # n_jobs=-1 fits the one-vs-rest binary problems on all cores.
+                pipeline = Pipeline([
+                    # float32 halves the memory of the sparse matrices fed to SGD.
+                    ('hash', HashingVectorizer(
+                        n_features=_HASH_FEATURES, alternate_sign=False, ngram_range=(1, 2), norm=None,
+                        token_pattern=_TOKEN_PATTERN, dtype=np.float32,
+                    )),
+                    ('tfidf', TfidfTransformer(sublinear_tf=True)),
+                    ('clf', SGDClassifier(loss='hinge', penalty='l2', alpha=1e-3, random_state=42, max_iter=5, tol=None, n_jobs=-1)),
+                ])
+                hasher = pipeline.named_steps['hash']
+
+                labels = np.empty(n_rows, dtype=object)
+                chunks = []
+                n_seen = 0
+                cursor.execute("SELECT o.text, d.type " + _TRAINING_FILTER)
+                for texts, chunk_labels in _iter_batches(cursor, _FETCH_BATCH):
+                    take = min(len(texts), n_rows - n_seen)
+                    if take <= 0:
+                        break
+                    chunks.append(hasher.transform(texts[:take]))
+                    labels[n_seen:n_seen + take] = chunk_labels[:take]
+                    n_seen += take
+
+            logger.info(f"Training on {n_seen} documents...")
+            features = pipeline.named_steps['tfidf'].fit_transform(sp.vstack(chunks, format='csr'))
+            labels = labels[:n_seen]
+            del chunks
+
+            clf = pipeline.named_steps['clf']
+            rng = np.random.default_rng(42)
+            for _ in range(_TRAIN_EPOCHS):
+                order = rng.permutation(n_seen)
+                for start in range(0, n_seen, _TRAIN_BATCH):
+                    idx = order[start:start + _TRAIN_BATCH]
+                    clf.partial_fit(features[idx], labels[idx], classes=classes)
+
             # Save
             self.model_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.model_path, "wb") as f:
-                pickle.dump(pipeline, f)
-                
-            return True, f"Model trained successfully on {len(texts)} documents."
-            
+            # joblib stores the numpy buffers (coef_, idf_) raw and aligned so the
+            # classifier can memory-map them on load instead of copying them.
+            joblib.dump(pipeline, self.model_path, compress=self.compress or 0)
+
+            return True, f"Model trained successfully on {n_seen} documents."
+
         except Exception as e:
             logger.error(f"Training failed: {e}")
             return False, str(e)
@@ -1,10 +1,39 @@
+import asyncio
+import json
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ImportError:
     OpenAI = None
+    AsyncOpenAI = None
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _strip_fence(content: Optional[str]) -> str:
+    """Remove a surrounding Markdown code fence (```json ... ```) from a model reply."""
+    return (content or "").strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+
+def _parse_json(content: str) -> Optional[Any]:
+    """Parse ``content`` as JSON (orjson when available); ``None`` if it is not valid JSON."""
+    try:
+        return orjson.loads(content) if orjson is not None else json.loads(content)
+    except ValueError:
+        return None
+
+
+_DOCUMENT_SYSTEM_PROMPT = (
+    "Eres un asistente administrativo experto en análisis documental. "
+    "Tu tarea es extraer información clave, corregir errores de OCR obvios y resumir el contenido.\n"
+    "Devuelve la respuesta en formato JSON puro."
+)
+
 
 class LLMClient:
     """
@@ -22,6 +51,9 @@ class LLMClient:
         self.timeout = self.config.get("timeout", 60)
         
         self._client = None
+        # Async client (and its connection pool) is bound to the event loop it was created on
+        self._aclient = None
+        self._aclient_loop = None
         if self.enabled:
             self._init_client()
 
@@ -42,6 +74,43 @@ class LLMClient:
             self.logger.error(f"Error al inicializar cliente LLM: {e}")
             self.enabled = False
 
+    def _get_async_client(self):
+        """Return the async client for the running loop, reusing its connection pool."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                timeout=self.timeout
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    @staticmethod
+    def _document_messages(text: str, reason: str, doc_type: str) -> List[Dict[str, str]]:
+        system_prompt = _DOCUMENT_SYSTEM_PROMPT
+
+        user_prompt = (
+            f"Analiza el siguiente documento clasificado como '{doc_type}'.\n"
+            f"Contexto de revisión: {reason}\n\n"
+            f"--- TEXTO OCR ---\n{text[:4000]}...\n-----------------" # Truncate to avoid context limit
+        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    def _document_result(self, content: str) -> Dict[str, Any]:
+        # Basic cleanup if model returns markdown fencing
+        content = _strip_fence(content)
+        
+        return {
+            "success": True, 
+            "analysis": content,
+            "data": _parse_json(content),
+            "model_used": self.model
+        }
+
     def analyze_document(self, text: str, reason: str, doc_type: str = "Documento") -> Dict[str, Any]:
         """
         Envía el texto del documento al LLM para su análisis.
@@ -49,43 +118,117 @@ class LLMClient:
         if not self.enabled or not self._client:
             return {"error": "LLM deshabilitado o no inicializado"}
 
-        system_prompt = (
-            "Eres un asistente administrativo experto en análisis documental. "
-            "Tu tarea es extraer información clave, corregir errores de OCR obvios y resumir el contenido.\n"
-            "Devuelve la respuesta en formato JSON puro."
-        )
+        try:
+            self.logger.info(f"Enviando solicitud al LLM ({self.model})...")
+            response = self._client.chat.completions.create(
+                model=self.model,
+                messages=self._document_messages(text, reason, doc_type),
+                temperature=0.1,
+            )
+            
+            return self._document_result(response.choices[0].message.content)
+
+        except Exception as e:
+            self.logger.error(f"Error en llamada al LLM: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def analyze_documents(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Analiza varios documentos ``(text, reason, doc_type)`` de forma concurrente.
+
+        Las solicitudes comparten el pool de conexiones del cliente asíncrono y
+        se limitan a ``concurrency`` simultáneas.  Los resultados mantienen el
+        orden de ``items``.  Uso síncrono: ``asyncio.run(client.analyze_documents(items))``.
+        """
+        items = list(items)
+        if not self.enabled or not self._client or AsyncOpenAI is None:
+            return [{"error": "LLM deshabilitado o no inicializado"} for _ in items]
+
+        client = self._get_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(text: str, reason: str, doc_type: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    response = await client.chat.completions.create(
+                        model=self.model,
+                        messages=self._document_messages(text, reason, doc_type),
+                        temperature=0.1,
+                    )
+                    return self._document_result(response.choices[0].message.content)
+                except Exception as e:
+                    self.logger.error(f"Error en llamada al LLM: {e}")
+                    return {"success": False, "error": str(e)}
+
+        self.logger.info(f"Enviando {len(items)} solicitudes al LLM ({self.model})...")
+        return list(await asyncio.gather(*(_one(*item) for item in items)))
+
+    def analyze_documents_batch(self, items: Iterable[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Analiza varios documentos ``(text, reason, doc_type)`` en una única solicitud.
 
+        Todos los documentos comparten el prompt de sistema y una sola llamada
+        HTTP; el modelo devuelve ``{"results": [{"id": i, ...}, ...]}`` y cada
+        entrada se reparte al documento ``i``.  Los resultados mantienen el
+        orden de ``items``; los documentos que el modelo omite se marcan como
+        error.
+        """
+        items = list(items)
+        if not items:
+            return []
+        if not self.enabled or not self._client:
+            return [{"error": "LLM deshabilitado o no inicializado"} for _ in items]
+
+        documents = [
+            {"id": i, "doc_type": doc_type, "reason": reason, "text": text[:4000]}
+            for i, (text, reason, doc_type) in enumerate(items)
+        ]
         user_prompt = (
-            f"Analiza el siguiente documento clasificado como '{doc_type}'.\n"
-            f"Contexto de revisión: {reason}\n\n"
-            f"--- TEXTO OCR ---\n{text[:4000]}...\n-----------------" # Truncate to avoid context limit
+            f"Analiza cada uno de los siguientes {len(documents)} documentos por separado.\n"
+            'Devuelve un objeto JSON {"results": [...]} con un elemento por documento '
+            'que incluya su "id".\n\n'
+            + json.dumps(documents, ensure_ascii=False)
         )
 
         try:
-            self.logger.info(f"Enviando solicitud al LLM ({self.model})...")
+            self.logger.info(f"Enviando lote de {len(items)} documentos al LLM ({self.model})...")
             response = self._client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _DOCUMENT_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.1,
+                response_format={"type": "json_object"},
             )
-            
-            content = response.choices[0].message.content
-            # Basic cleanup if model returns markdown fencing
-            if content.startswith("```json"):
-                content = content.replace("```json", "").replace("```", "")
-            
-            return {
-                "success": True, 
-                "analysis": content,
-                "model_used": self.model
-            }
-
+            payload = _parse_json(_strip_fence(response.choices[0].message.content))
         except Exception as e:
             self.logger.error(f"Error en llamada al LLM: {e}")
-            return {"success": False, "error": str(e)}
+            return [{"success": False, "error": str(e)} for _ in items]
+
+        entries = payload.get("results") if isinstance(payload, dict) else payload
+        by_id: Dict[int, Any] = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("id"), int):
+                by_id[entry["id"]] = entry
+
+        results: List[Dict[str, Any]] = []
+        for i in range(len(items)):
+            entry = by_id.get(i)
+            if entry is None:
+                results.append({"success": False, "error": "Documento ausente en la respuesta del LLM"})
+            else:
+                results.append({
+                    "success": True,
+                    "analysis": json.dumps(entry, ensure_ascii=False),
+                    "data": entry,
+                    "model_used": self.model
+                })
+        return results
 
     def analyze_sketch_ocr(self, text: str) -> Dict[str, Any]:
         """
@@ -111,8 +254,8 @@ class LLMClient:
                 temperature=0.2,
                 response_format={ "type": "json_object" } # Force JSON mode if supported
             )
-            content = response.choices[0].message.content
-            return {"success": True, "analysis": content}
+            content = _strip_fence(response.choices[0].message.content)
+            return {"success": True, "analysis": content, "data": _parse_json(content)}
         except Exception as e:
             self.logger.error(f"Sketch analysis failed: {e}")
             return {"success": False, "error": str(e)}
@@ -126,6 +269,7 @@ class LLMClient:
             
         import base64
         import mimetypes
+        import mmap
 
         try:
             # Check file size/existence
@@ -137,8 +281,13 @@ class LLMClient:
             if not mime_type or not mime_type.startswith('image'):
                 mime_type = 'image/jpeg'
                 
+            # Encode straight from a memory map of the file so the raw bytes are
+            # never copied onto the heap; decode the ASCII result only once.
             with open(image_path, "rb") as image_file:
-                base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+                if os.fstat(image_file.fileno()).st_size == 0:
+                    return {"success": False, "error": "Image file is empty"}
+                with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    image_url = f"data:{mime_type};base64," + base64.b64encode(mapped).decode("ascii")
             
             system_prompt = (
                 "You are an expert architect analyzing a hand-drawn floor plan (sketch). "
@@ -159,7 +308,7 @@ class LLMClient:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:{mime_type};base64,{base64_image}"
+                                    "url": image_url
                                 }
                             }
                         ]
@@ -169,12 +318,10 @@ class LLMClient:
                 max_tokens=500,
             )
             
-            content = response.choices[0].message.content
             # Cleanup Markdown
-            if content.startswith("```json"):
-                content = content.replace("```json", "").replace("```", "")
+            content = _strip_fence(response.choices[0].message.content)
                 
-            return {"success": True, "analysis": content}
+            return {"success": True, "analysis": content, "data": _parse_json(content)}
 
         except Exception as e:
             self.logger.error(f"Vision analysis failed: {e}")
@@ -23,37 +23,98 @@ call.
 
 from __future__ import annotations
 
+import atexit
+import datetime
 import logging
 import os
+import queue
+import threading
 from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from .db_manager import DBManager
 
 
 class DBLogHandler(logging.Handler):
-    """Custom log handler that writes events to the database via DBManager."""
+    """
+    Custom log handler that writes events to the database via DBManager.
+
+    ``emit`` only enqueues the record; a background thread drains the queue
+    and writes up to ``batch_size`` entries per transaction, so logging never
+    waits on a database commit.  When the queue is full new records are
+    dropped instead of blocking the caller.  Pending entries are flushed when
+    the handler is closed (including at interpreter exit).
+    """
 
-    def __init__(self, db_manager: DBManager) -> None:
+    def __init__(
+        self,
+        db_manager: DBManager,
+        max_queue: int = 10000,
+        batch_size: int = 500,
+    ) -> None:
         super().__init__()
         self.db_manager = db_manager
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._drain, name="DBLogHandler", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.close)
 
     def emit(self, record: logging.LogRecord) -> None:
+        if self._closed:
+            return
         try:
             msg = self.format(record)
             detail = None
             if record.exc_info:
                 # Format the exception traceback separately
-                detail = self.formatException(record.exc_info)
-            self.db_manager.insert_log(
-                event=msg,
-                detail=detail,
-                level=record.levelname,
-            )
+                detail = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+            timestamp = datetime.datetime.fromtimestamp(record.created).isoformat()
+            self._queue.put_nowait((timestamp, msg, detail, record.levelname))
+        except queue.Full:
+            # Drop rather than stall the caller
+            pass
         except Exception:
             # Avoid infinite recursion if logging from within DB insert
             pass
 
+    def _drain(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: List[Tuple[str, str, Optional[str], str]] = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self.db_manager.insert_logs(batch)
+                except Exception:
+                    # Avoid infinite recursion if logging from within DB insert
+                    pass
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            try:
+                self._queue.put(None, timeout=5.0)
+            except queue.Full:
+                pass
+            self._worker.join(timeout=5.0)
+            atexit.unregister(self.close)
+        super().close()
+
 
 def setup_logger(
     log_file: str,
@@ -89,6 +150,7 @@ def setup_logger(
     # Clear any existing handlers attached to this logger
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
+        handler.close()
 
     # Console handler
     console_handler = logging.StreamHandler()
@@ -1,8 +1,14 @@
 """
 Centralised Loguru configuration for AutOCR.
 
-When imported, this module configures Loguru to emit structured logs to both
-stdout and a rotating file in ``logs/autocr.log``.
+Calling :func:`init_loguru` configures Loguru to emit structured logs to both
+stdout and a rotating file in ``logs/autocr.log`` and routes standard
+``logging`` records through it.  Passing a ``DBManager`` also persists
+records to the ``logs`` table through an ``enqueue=True`` sink, so the
+database write happens on Loguru's writer thread rather than in the caller.
+Importing the module has no side effects, so
+library code and workers that use :func:`modules.logger_manager.setup_logger`
+do not get a second, competing configuration.
 """
 
 from __future__ import annotations
@@ -10,28 +16,18 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import Any
+import traceback
+from typing import TYPE_CHECKING, Any, Optional
 
 from loguru import logger
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .db_manager import DBManager
+
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
-
-logger.remove()
-logger.add(
-    sys.stdout,
-    format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}",
-    colorize=True,
-    enqueue=True,
-)
-logger.add(
-    os.path.join(LOG_DIR, "autocr.log"),
-    rotation="5 MB",
-    level="INFO",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
-    enqueue=True,
-)
-logger.info("🧩 Logger initialized.")
+
+_initialised = False
+_db_sink_id: Optional[int] = None
 
 
 class InterceptHandler(logging.Handler):
@@ -51,8 +47,59 @@ class InterceptHandler(logging.Handler):
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
-logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO)
+def _db_sink(db_manager: "DBManager"):
+    """Build a sink that writes each record into the ``logs`` table."""
+
+    def sink(message: Any) -> None:
+        record = message.record
+        exc = record["exception"]
+        detail = None
+        if exc is not None and exc.type is not None:
+            detail = "".join(traceback.format_exception(exc.type, exc.value, exc.traceback))
+        try:
+            db_manager.insert_log(event=record["message"], detail=detail, level=record["level"].name)
+        except Exception:
+            # Avoid infinite recursion if logging from within DB insert
+            pass
+
+    return sink
+
+
+def init_loguru(db_manager: Optional["DBManager"] = None) -> None:
+    """
+    Configure Loguru sinks and intercept stdlib logging (idempotent).
+
+    When ``db_manager`` is given, a database sink is added once, even if the
+    console/file sinks were configured by an earlier call.
+    """
+    global _initialised, _db_sink_id
+    if not _initialised:
+        _initialised = True
+        _configure_base_sinks()
+    if db_manager is not None and _db_sink_id is None:
+        _db_sink_id = logger.add(_db_sink(db_manager), level="INFO", enqueue=True)
+
+
+def _configure_base_sinks() -> None:
+    os.makedirs(LOG_DIR, exist_ok=True)
+
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}",
+        colorize=True,
+        enqueue=True,
+    )
+    logger.add(
+        os.path.join(LOG_DIR, "autocr.log"),
+        rotation="5 MB",
+        level="INFO",
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+        enqueue=True,
+    )
+    logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO)
+    logger.info("🧩 Logger initialized.")
 
 
-__all__ = ["logger"]
+__all__ = ["logger", "init_loguru"]
 
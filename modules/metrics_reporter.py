@@ -14,11 +14,11 @@ generation is optional and requires the ``reportlab`` package.
 
 from __future__ import annotations
 
+import csv
 import datetime
+import itertools
 import os
-from typing import Iterable, List, Mapping
-
-import pandas as pd
+from typing import Iterable, List, Mapping, Optional
 
 try:
     from reportlab.lib.pagesizes import A4
@@ -56,12 +56,21 @@ def _write_pdf(
     # Column headers
     headers = ["Filename", "Status", "Duration (s)", "Type"]
     col_widths = [70 * mm, 30 * mm, 30 * mm, 40 * mm]
-    c.setFont("Helvetica-Bold", 9)
-    for i, header in enumerate(headers):
-        c.drawString(x + sum(col_widths[:i]), y, header)
+    col_offsets = list(itertools.accumulate([0] + col_widths))
+
+    # The table is laid out in one text object per page, emitted with a
+    # single drawText call instead of one drawString per cell.
+    def draw_cells(text, cells: List[str], row_y: float) -> None:
+        for i, cell in enumerate(cells):
+            text.setTextOrigin(x + col_offsets[i], row_y)
+            text.textOut(cell)
+
+    text = c.beginText()
+    text.setFont("Helvetica-Bold", 9)
+    draw_cells(text, headers, y)
     y -= 12
 
-    c.setFont("Helvetica", 9)
+    text.setFont("Helvetica", 9)
     # Rows
     for record in records:
         row = [
@@ -71,17 +80,18 @@ def _write_pdf(
             str(record.get("type", ""))[:30],
         ]
         if y < margin + 40:
+            c.drawText(text)
             c.showPage()
             y = height - margin
             # repeat header
-            c.setFont("Helvetica-Bold", 9)
-            for i, header in enumerate(headers):
-                c.drawString(x + sum(col_widths[:i]), y, header)
+            text = c.beginText()
+            text.setFont("Helvetica-Bold", 9)
+            draw_cells(text, headers, y)
             y -= 12
-            c.setFont("Helvetica", 9)
-        for i, cell in enumerate(row):
-            c.drawString(x + sum(col_widths[:i]), y, cell)
+            text.setFont("Helvetica", 9)
+        draw_cells(text, row, y)
         y -= 12
+    c.drawText(text)
 
     # Aggregated metrics
     y -= 10
@@ -140,8 +150,13 @@ def generate_summary_report(
     ts = prefix or datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     csv_path = os.path.join(report_folder, f"{ts}_summary.csv")
     records_list = list(records)
-    df = pd.DataFrame(records_list)
-    df.to_csv(csv_path, index=False)
+    # Columns in first-seen order across all records
+    fieldnames = list(dict.fromkeys(key for record in records_list for key in record))
+    with open(csv_path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fieldnames, lineterminator=os.linesep)
+        if fieldnames:
+            writer.writeheader()
+        writer.writerows(records_list)
 
     # Prepare metrics for PDF
     metrics_data = metrics or {
@@ -9,6 +9,8 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,11 @@ class DataNormalizer:
         r'\bCorp\.?', r'\bGmbH', r'\bLLC', r'\bLimited'
     ]
     
+    # All suffixes as one alternation so each vendor string is scanned once
+    _SUFFIX_RE = re.compile('|'.join(f'(?:{suffix})' for suffix in LEGAL_SUFFIXES), re.IGNORECASE)
+    
+    _ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+    
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize normalizer with optional configuration."""
         self.config = config or {}
@@ -48,6 +55,45 @@ class DataNormalizer:
             
         return normalized
     
+    def normalize_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Normalize many documents at once using column-wise string operations.
+        
+        Args:
+            df: One row per document with flat ``vendor``, ``total`` and
+                ``date`` columns (``currency`` optional); absent columns are
+                skipped. Rows from ``pd.read_sql`` can be passed directly.
+            
+        Returns:
+            Normalized copy of ``df``
+        """
+        df = df.copy()
+        
+        if 'date' in df:
+            not_iso = ~df['date'].astype(str).str.match(self._ISO_DATE_RE)
+            if not_iso.any():
+                logger.warning(f"{int(not_iso.sum())} dates not in ISO format")
+        
+        if 'total' in df:
+            df['total'] = pd.to_numeric(df['total'], errors='coerce').round(2)
+            if 'currency' in df:
+                df['currency'] = df['currency'].fillna('EUR')
+            else:
+                df['currency'] = 'EUR'  # Default
+        
+        if 'vendor' in df:
+            vendor = (
+                df['vendor']
+                .str.replace(self._SUFFIX_RE, '', regex=True)
+                .str.split()
+                .str.join(' ')
+            )
+            upper = vendor.str.isupper().fillna(False).astype(bool)
+            vendor[upper] = vendor[upper].str.title()
+            df['vendor'] = vendor
+        
+        return df
+    
     def _normalize_date(self, date_field: Dict) -> Dict:
         """Ensure date is in ISO 8601 format (YYYY-MM-DD)."""
         # Date should already be normalized by FieldExtractor
@@ -55,14 +101,17 @@ class DataNormalizer:
         value = date_field.get('value', '')
         
         # Verify it's ISO format
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', value):
-            logger.warning(f"Date not in ISO format: {value}")
-            
+        if isinstance(value, str) and self._ISO_DATE_RE.match(value):
+            return date_field
+        
+        logger.warning(f"Date not in ISO format: {value}")
         return date_field
     
     def _normalize_amount(self, amount_field: Dict) -> Dict:
         """Ensure amount is numeric with currency code."""
         # Amount should already be normalized by FieldExtractor
+        # Work on a copy so the caller's extraction result is left untouched
+        amount_field = dict(amount_field)
         # Ensure value is float
         if isinstance(amount_field.get('value'), (int, float)):
             amount_field['value'] = round(float(amount_field['value']), 2)
@@ -78,8 +127,7 @@ class DataNormalizer:
         value = vendor_field.get('value', '')
         
         # Remove legal suffixes
-        for suffix in self.LEGAL_SUFFIXES:
-            value = re.sub(suffix, '', value, flags=re.IGNORECASE)
+        value = self._SUFFIX_RE.sub('', value)
         
         # Normalize whitespace
         value = ' '.join(value.split())
@@ -88,10 +136,8 @@ class DataNormalizer:
         if value.isupper():
             value = value.title()
         
-        vendor_field['value'] = value.strip()
-        vendor_field['normalized'] = True
-        
-        return vendor_field
+        # Return a new dict so the caller's extraction result is left untouched
+        return {**vendor_field, 'value': value.strip(), 'normalized': True}
 
 
 __all__ = ['DataNormalizer']
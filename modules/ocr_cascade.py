@@ -8,12 +8,28 @@ components while offering resilience when individual engines fail.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import methodcaller
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
+import cv2
+import numpy as np
 from loguru import logger
-from PIL import Image
+from PIL import Image, ImageOps
 
-from .paddle_singleton import get_ppstructure_v3_instance
+from . import file_utils
+from .paddle_singleton import get_ppstructure_v3_instance, inference_lock
 
 try:
     import easyocr  # type: ignore
@@ -27,82 +43,715 @@ except ImportError as exc:  # pragma: no cover - optional dependency
     pytesseract = None  # type: ignore[assignment]
     logger.error("❌ pytesseract import failed: {}", exc)
 
+# EasyOCR (torch) and PaddleOCR share the GPU; growable segments and a split
+# cap keep torch's caching allocator from fragmenting it.  Must be set before
+# the first CUDA allocation, so it is applied at import time.
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF",
+    "expandable_segments:True,max_split_size_mb:128,roundup_power2_divisions:16",
+)
+
+try:
+    import requests  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    requests = None  # type: ignore[assignment]
+
 try:
     import torch  # type: ignore
 except (ImportError, OSError):  # pragma: no cover - optional dependency
     torch = None  # type: ignore[assignment]
 
+# Results are keyed by file content, so retries and re-segmented copies of the
+# same image skip the engines entirely.
+_CACHE_SIZE = 512
+_CACHE_HASH = "xxh3" if file_utils.xxhash is not None else "blake2b"
+
+# EasyOCR batching: images whose sides are within this fraction of a bucket's
+# smallest image share one ``readtext_batched`` call at the bucket's max size.
+_EASY_BUCKET_TOLERANCE = 0.2
+_EASY_BATCH_SIZE = 16
+
+_TESSERACT_LANG = "spa+eng"
+
+# Longest image side fed to the engines; override with OCR_MAX_SIDE (0 disables).
+_MAX_SIDE = 2000
+
+# Pages whose downscaled grayscale thumbnail has a lower standard deviation
+# than this are treated as blank and never reach an engine.
+_BLANK_THUMB_SIZE = (128, 128)
+_BLANK_STD_THRESHOLD = 3.0
+
+# EasyOCR readers keyed by (languages, gpu); each one holds its own copy of the
+# detector/recogniser weights, so MultiOCR instances share them per process.
+_easy_readers: Dict[Tuple[Tuple[str, ...], bool], Any] = {}
+_easy_readers_lock = threading.Lock()
+# Inference on the shared readers and the PPStructureV3 singleton is not
+# thread-safe, so one process-wide lock (the singleton's own) serialises it
+# across all MultiOCR instances.
+_engine_lock = inference_lock
+# Reader keys already compiled/warmed by a MultiOCR (other users, such as the
+# healthcheck, may create readers without that preparation).
+_warmed_readers: set = set()
+# Set once the shared PPStructureV3 instance has run its warm-up inference.
+_paddle_warm = False
+
+
+def _inference_mode(half: bool = False) -> Any:
+    """
+    ``torch.inference_mode()`` when torch is available, so EasyOCR skips
+    autograd bookkeeping.  With ``half`` the convolutions and matmuls also run
+    in FP16 on CUDA via autocast (weights stay FP32, so EasyOCR's own input
+    handling is untouched).
+    """
+    if torch is None:
+        return contextlib.nullcontext()
+    if not half:
+        return torch.inference_mode()  # type: ignore[union-attr]
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())  # type: ignore[union-attr]
+    stack.enter_context(torch.autocast(device_type="cuda", dtype=torch.float16))  # type: ignore[union-attr]
+    return stack
+
+
+def get_easy_reader(langs: Tuple[str, ...], gpu: bool) -> Any:
+    """Return the process-wide EasyOCR reader for ``langs``/``gpu``, creating it once."""
+    key = (langs, gpu)
+    with _easy_readers_lock:
+        reader = _easy_readers.get(key)
+        if reader is not None:
+            logger.debug("EasyOCR reader cache hit for {}", key)
+            return reader
+        logger.debug("EasyOCR reader cache miss for {}", key)
+        try:
+            reader = easyocr.Reader(list(langs), gpu=gpu, cudnn_benchmark=gpu)  # type: ignore[union-attr]
+        except TypeError:  # older EasyOCR without cudnn_benchmark
+            reader = easyocr.Reader(list(langs), gpu=gpu)  # type: ignore[union-attr]
+        _easy_readers[key] = reader
+        return reader
+
+
+_get_res = methodcaller("get", "res")
+
+
+def _paddle_texts(results: Sequence[Dict[str, Any]]) -> List[str]:
+    """Flatten PPStructureV3 blocks (``res`` items are ``[box, (text, score)]``) into stripped texts."""
+    items = chain.from_iterable(
+        res for res in map(_get_res, results) if res and isinstance(res, list)
+    )
+    data = (
+        item[1]
+        for item in items
+        if isinstance(item, (list, tuple)) and len(item) == 2
+    )
+    return [
+        text
+        for text in (str(d[0]).strip() for d in data if d and isinstance(d, (list, tuple)))
+        if text
+    ]
+
+
+def mps_available() -> bool:
+    """Whether the CUDA MPS control daemon binary is on ``PATH``."""
+    return shutil.which("nvidia-cuda-mps-control") is not None
+
+
+# Per-process engine for pools created by MultiOCR.spawn_pool.
+_pool_ocr: Optional["MultiOCR"] = None
+
+
+def _init_pool_worker(langs: Optional[Sequence[str]]) -> None:
+    global _pool_ocr
+    _pool_ocr = MultiOCR(langs)
+
+
+def _run_pool_task(task: Tuple[int, str]) -> Tuple[int, List[Dict[str, Any]]]:
+    idx, path = task
+    return idx, _pool_ocr.run(path)  # type: ignore[union-attr]
+
 
 class MultiOCR:
     """
     Run OCR engines in a cascade: PaddleOCR → EasyOCR → Tesseract.
     """
 
-    def __init__(self, langs: Sequence[str] | None = None) -> None:
+    def __init__(self, langs: Sequence[str] | None = None, cache_size: int = _CACHE_SIZE) -> None:
         self.langs = list(langs) if langs else ["en", "es"]
         self.gpu_available = bool(torch and torch.cuda.is_available())  # type: ignore[union-attr]
+        # FP16 recognition on GPU is opt-in until validated against a regression set.
+        self.half = self.gpu_available and os.getenv("OCR_FP16", "0") == "1"
         logger.info("🧠 GPU available: {}", self.gpu_available)
+        if self.gpu_available:
+            self._limit_gpu_memory()
         logger.info("🔤 OCR cascade languages: {}", self.langs)
 
         self._paddle_ocr = None
+        self._paddle_resolved = False
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._engine_lock = _engine_lock
 
         if easyocr is None:
             raise ImportError("EasyOCR is required for the OCR cascade.")
-        self.easy = easyocr.Reader(self.langs, gpu=self.gpu_available)  # type: ignore[misc]
+        reader_key = (tuple(self.langs), self.gpu_available)
+        self.easy = get_easy_reader(*reader_key)
         logger.info("✅ EasyOCR initialized.")
+        if self.gpu_available:
+            with _easy_readers_lock:
+                warm = reader_key in _warmed_readers
+                _warmed_readers.add(reader_key)
+            if not warm:
+                self._compile_recognizer()
+            self._warmup(easy=not warm)
+
+    @staticmethod
+    def _limit_gpu_memory() -> None:
+        """Cap torch's share of VRAM (``OCR_MEM_FRAC``, default 0.5) so Paddle can coexist."""
+        try:
+            fraction = float(os.getenv("OCR_MEM_FRAC", "0.5"))
+            torch.cuda.set_per_process_memory_fraction(fraction)  # type: ignore[union-attr]
+            logger.info("🧮 Torch GPU memory fraction: {}", fraction)
+        except Exception as exc:  # pragma: no cover - CUDA runtime errors
+            logger.warning("⚠️ Could not set GPU memory fraction: {}", exc)
+
+    def _compile_recognizer(self) -> None:
+        """
+        Opt-in (``OCR_TORCH_COMPILE=1``): compile EasyOCR's CRNN recogniser with
+        ``torch.compile(mode="reduce-overhead")``, which captures CUDA graphs
+        per input shape and replays them instead of launching each kernel.
+        Pays off with the fixed bucket sizes of :meth:`run_batch`.
+        """
+        if os.getenv("OCR_TORCH_COMPILE", "0") != "1" or not hasattr(torch, "compile"):
+            return
+        recognizer = getattr(self.easy, "recognizer", None)
+        if recognizer is None:
+            return
+        try:
+            self.easy.recognizer = torch.compile(recognizer, mode="reduce-overhead")  # type: ignore[union-attr]
+            logger.info("⚙️ EasyOCR recogniser compiled (CUDA graphs).")
+        except Exception as exc:  # pragma: no cover - torch runtime errors
+            logger.warning("⚠️ torch.compile of EasyOCR recogniser failed, staying eager: {}", exc)
+
+    def _warmup(self, easy: bool = True) -> None:
+        """
+        Run throwaway inferences on a small white image so cuDNN autotuning
+        and lazy initialisation happen here rather than on the first real page.
+        Each engine is warmed once per process.
+        """
+        global _paddle_warm
+        dummy = np.full((64, 256, 3), 255, dtype=np.uint8)
+        if easy:
+            try:
+                with _inference_mode(self.half):
+                    self.easy.readtext(dummy, detail=0)
+            except Exception as exc:  # pragma: no cover - EasyOCR runtime errors
+                logger.warning("⚠️ EasyOCR warm-up failed: {}", exc)
+        if not _paddle_warm and self.paddle is not None:
+            _paddle_warm = True
+            try:
+                with self._engine_lock:
+                    self.paddle(dummy)
+            except Exception as exc:  # pragma: no cover - Paddle runtime errors
+                logger.warning("⚠️ PaddleOCR warm-up failed: {}", exc)
+
+    @classmethod
+    def spawn_pool(cls, processes: int, langs: Sequence[str] | None = None) -> Any:
+        """
+        Start ``processes`` worker processes, each holding its own MultiOCR.
+
+        Workers use the ``spawn`` start method (Paddle/CUDA cannot be
+        initialised in a forked child).  Several processes only overlap on one
+        GPU under CUDA MPS; without it their kernels are serialised, so a
+        warning is logged.  Use with :meth:`map_pool` and close the pool when done.
+        """
+        if mps_available():
+            logger.info("🧵 CUDA MPS control found; GPU work from {} workers can overlap.", processes)
+        else:
+            logger.warning("⚠️ CUDA MPS not found; {} GPU workers will be time-sliced.", processes)
+        ctx = multiprocessing.get_context("spawn")
+        return ctx.Pool(processes=processes, initializer=_init_pool_worker, initargs=(list(langs) if langs else None,))
+
+    @staticmethod
+    def map_pool(pool: Any, image_paths: Sequence[str]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Yield ``(index, result)`` pairs from ``pool`` as soon as each image finishes."""
+        return pool.imap_unordered(_run_pool_task, enumerate(image_paths))
+
+    @property
+    def paddle(self):
+        """Shared PPStructureV3 engine, resolved on first use (``None`` if unavailable)."""
+        if not self._paddle_resolved:
+            self._paddle_ocr = get_ppstructure_v3_instance()
+            self._paddle_resolved = True
+        return self._paddle_ocr
+
+    @staticmethod
+    def _load_image(image_path: str) -> Optional[np.ndarray]:
+        """
+        Decode ``image_path`` once into a BGR array shared by every engine,
+        clamping the longest side to ``OCR_MAX_SIDE`` pixels (default 2000).
+
+        JPEGs are decoded in draft mode straight at a reduced DCT scale, so a
+        600 DPI scan never materialises at full resolution.
+        """
+        max_side = int(os.getenv("OCR_MAX_SIDE", str(_MAX_SIDE)))
+        try:
+            with Image.open(image_path) as image:
+                if max_side > 0 and max(image.size) > max_side:
+                    image.draft("RGB", (max_side, max_side))
+                image = ImageOps.exif_transpose(image).convert("RGB")
+                if max_side > 0 and max(image.size) > max_side:
+                    image.thumbnail((max_side, max_side), Image.BILINEAR)
+                return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2BGR)
+        except Exception as exc:
+            logger.warning("⚠️ Could not decode {}: {}", image_path, exc)
+            return None
+
+    def _cache_get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+        return [dict(item) for item in result]
+
+    def _cache_put(self, key: str, result: List[Dict[str, Any]]) -> None:
+        with self._cache_lock:
+            self._cache[key] = [dict(item) for item in result]
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _is_blank(image_path: str) -> bool:
+        """Cheaply detect an empty page from a small grayscale thumbnail."""
+        try:
+            with Image.open(image_path) as image:
+                # JPEG decodes straight to a reduced size in draft mode.
+                image.draft("L", _BLANK_THUMB_SIZE)
+                thumb = image.convert("L")
+                thumb.thumbnail(_BLANK_THUMB_SIZE)
+                blank = float(np.asarray(thumb, dtype=np.float32).std()) < _BLANK_STD_THRESHOLD
+        except Exception:
+            return False
+        if blank:
+            logger.info("⏭️ Skipped blank page {}", image_path)
+        return blank
 
     def run(self, image_path: str) -> List[Dict[str, Any]]:
         """
         Execute the OCR cascade and return normalised results.
+
+        Blank pages return an empty result without running any engine.
+        Non-empty results are cached by a hash of the file contents.
         """
-        if self.paddle is not None:
+        if self._is_blank(image_path):
+            return [{"text": ""}]
+
+        key = None
+        if self._cache_size > 0:
             try:
-                logger.info("▶️ Running PaddleOCR (PPStructureV3) on {}", image_path)
-                # PPStructureV3 returns a list of blocks
-                results = self.paddle(image_path)
-                if results:
-                    texts = []
-                    for block in results:
-                        res = block.get("res")
-                        if res and isinstance(res, list):
-                            for item in res:
-                                if isinstance(item, (list, tuple)) and len(item) == 2:
-                                    # item: [box, (text, score)]
-                                    data = item[1]
-                                    if data and isinstance(data, (list, tuple)):
-                                        text = (str(data[0]) or "").strip()
-                                        if text:
-                                            texts.append(text)
-                    
-                    if texts:
-                        logger.success("📄 PaddleOCR (Structural) succeeded.")
-                        return [{"text": "\n".join(texts)}]
-            except Exception as exc:  # pragma: no cover - Paddle runtime errors
-                logger.warning("⚠️ PaddleOCR failed: {}", exc)
-                logger.opt(exception=exc).debug("PaddleOCR exception stacktrace")
+                key = file_utils.compute_hash(image_path, _CACHE_HASH, block_size=1 << 20)
+            except OSError as exc:
+                logger.warning("⚠️ Could not hash {}: {}", image_path, exc)
+            if key is not None:
+                cached = self._cache_get(key)
+                if cached is not None:
+                    logger.info("♻️ OCR cache hit for {}", image_path)
+                    return cached
 
+        result = self._run_remote(image_path)
+        if result is None:
+            result = self._run_engines(image_path)
+        if key is not None and result[0].get("text", "").strip():
+            self._cache_put(key, result)
+        return result
+
+    @staticmethod
+    def _run_remote(image_path: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Send the image to the batching OCR service (``modules.ocr_service``)
+        when ``OCR_SERVICE_URL`` is set; ``None`` means run in-process instead.
+        """
+        base_url = os.getenv("OCR_SERVICE_URL")
+        if not base_url or requests is None:
+            return None
+        try:
+            with open(image_path, "rb") as handle:
+                response = requests.post(
+                    base_url.rstrip("/") + "/ocr",
+                    files={"file": (os.path.basename(image_path), handle)},
+                    timeout=float(os.getenv("OCR_SERVICE_TIMEOUT", "120")),
+                )
+            response.raise_for_status()
+            result = response.json()
+            if isinstance(result, list) and result:
+                return result
+        except Exception as exc:
+            logger.warning("⚠️ OCR service unavailable, running locally: {}", exc)
+        return None
+
+    def _run_engines(self, image_path: str) -> List[Dict[str, Any]]:
+        # Each engine falls back to the path only if the file could not be decoded here.
+        image = self._load_image(image_path)
+        source = image if image is not None else image_path
+
+        # PaddleOCR and EasyOCR share one (GPU) model each, so only one thread
+        # runs them at a time; Tesseract spawns its own process per call and
+        # is left outside the lock so concurrent pages overlap there.
+        with self._engine_lock:
+            text = self._run_paddle(source, image_path)
+            if text is None:
+                text = self._run_easy(source, image_path)
+        if text is None:
+            text = self._run_tesseract(image, image_path)
+        if text is not None:
+            return [{"text": text}]
+
+        logger.error("❌ OCR cascade produced empty result.")
+        return [{"text": ""}]
+
+    def _run_paddle(self, source: Any, image_path: str) -> Optional[str]:
+        if self.paddle is None:
+            return None
+        try:
+            logger.info("▶️ Running PaddleOCR (PPStructureV3) on {}", image_path)
+            # PPStructureV3 returns a list of blocks
+            results = self.paddle(source)
+            if results:
+                texts = _paddle_texts(results)
+                if texts:
+                    logger.success("📄 PaddleOCR (Structural) succeeded.")
+                    return "\n".join(texts)
+        except Exception as exc:  # pragma: no cover - Paddle runtime errors
+            logger.warning("⚠️ PaddleOCR failed: {}", exc)
+            logger.opt(exception=exc).debug("PaddleOCR exception stacktrace")
+        return None
+
+    def _run_easy(self, source: Any, image_path: str) -> Optional[str]:
         try:
             logger.info("▶️ Running EasyOCR on {}", image_path)
-            text_blocks = self.easy.readtext(image_path, detail=0)
+            with _inference_mode(self.half):
+                text_blocks = self.easy.readtext(source, detail=0)
             if text_blocks:
                 logger.success("📄 EasyOCR succeeded.")
-                return [{"text": "\n".join(text_blocks)}]
+                return "\n".join(text_blocks)
         except Exception as exc:  # pragma: no cover - EasyOCR runtime errors
             logger.warning("⚠️ EasyOCR failed: {}", exc)
+        return None
+
+    @staticmethod
+    def _tesseract_pipe(image: np.ndarray) -> Optional[str]:
+        """
+        Feed the decoded image to the tesseract binary over stdin/stdout,
+        skipping pytesseract's temporary files.  ``None`` if that is not possible.
+        """
+        command = getattr(getattr(pytesseract, "pytesseract", None), "tesseract_cmd", None) or "tesseract"
+        if shutil.which(command) is None:
+            return None
+        ok, encoded = cv2.imencode(".png", image, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+        if not ok:
+            return None
+        completed = subprocess.run(
+            [command, "stdin", "stdout", "-l", _TESSERACT_LANG],
+            input=encoded.tobytes(),
+            capture_output=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            logger.warning("⚠️ tesseract exited with {}: {}", completed.returncode, completed.stderr.decode(errors="replace").strip())
+            return None
+        return completed.stdout.decode("utf-8", errors="replace")
 
-        if pytesseract is not None:
+    @staticmethod
+    def _run_tesseract(image: Optional[np.ndarray], image_path: str) -> Optional[str]:
+        if pytesseract is None:
+            return None
+        try:
+            logger.info("▶️ Running Tesseract on {}", image_path)
+            text = MultiOCR._tesseract_pipe(image) if image is not None else None
+            if text is None:
+                # Fall back to pytesseract (temp-file round trip).
+                if image is not None:
+                    pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+                    text = pytesseract.image_to_string(pil_image, lang=_TESSERACT_LANG)
+                else:
+                    with Image.open(image_path) as pil_image:
+                        text = pytesseract.image_to_string(pil_image, lang=_TESSERACT_LANG)
+            if text.strip():
+                logger.success("📄 Tesseract succeeded.")
+                return text
+        except Exception as exc:  # pragma: no cover - pytesseract runtime errors
+            logger.error("❌ All OCR engines failed: {}", exc)
+        return None
+
+    async def run_many(
+        self, image_paths: Sequence[str], concurrency: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run the cascade over several images concurrently, preserving order.
+
+        Each image runs in a worker thread, at most ``concurrency`` at a time
+        (default: ``OCR_CONCURRENCY`` or the CPU count).  Decoding, hashing
+        and Tesseract subprocesses overlap across images.
+        """
+        if concurrency is None:
+            concurrency = int(os.getenv("OCR_CONCURRENCY", os.cpu_count() or 1))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(path: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self.run, path)
+
+        return list(await asyncio.gather(*(_one(path) for path in image_paths)))
+
+    @staticmethod
+    def _size_buckets(sizes: Dict[int, Tuple[int, int]]) -> List[Tuple[Tuple[int, int], List[int]]]:
+        """
+        Group image indices whose ``(width, height)`` are within
+        ``_EASY_BUCKET_TOLERANCE`` of each other; each bucket is snapped to its
+        largest width and height.
+
+        Both dimensions are bounded from above and below: a page only joins a
+        bucket if the bucket's largest width and height stay within the
+        tolerance of its smallest ones, so no page is stretched by more than
+        ``1 + _EASY_BUCKET_TOLERANCE`` along either axis.
+        """
+        limit = 1 + _EASY_BUCKET_TOLERANCE
+        buckets: List[Tuple[Tuple[int, int], List[int]]] = []
+        order = sorted(sizes, key=lambda i: (sizes[i][1], sizes[i][0]))
+        current: List[int] = []
+        min_w = max_w = min_h = max_h = 0
+        for idx in order:
+            w, h = sizes[idx]
+            if (
+                current
+                and max(max_w, w) <= min(min_w, w) * limit
+                and max(max_h, h) <= min(min_h, h) * limit
+            ):
+                current.append(idx)
+                min_w, max_w = min(min_w, w), max(max_w, w)
+                min_h, max_h = min(min_h, h), max(max_h, h)
+                continue
+            if current:
+                buckets.append(((max_w, max_h), current))
+            current = [idx]
+            min_w = max_w = w
+            min_h = max_h = h
+        if current:
+            buckets.append(((max_w, max_h), current))
+        return buckets
+
+    def _run_easy_batched(self, images: Dict[int, np.ndarray]) -> Dict[int, str]:
+        """Recognise several decoded images with size-bucketed ``readtext_batched`` calls."""
+        texts: Dict[int, str] = {}
+        sizes = {idx: (img.shape[1], img.shape[0]) for idx, img in images.items()}
+        for (width, height), indices in self._size_buckets(sizes):
             try:
-                logger.info("▶️ Running Tesseract on {}", image_path)
-                with Image.open(image_path) as image:
-                    text = pytesseract.image_to_string(image, lang="spa+eng")
-                if text.strip():
-                    logger.success("📄 Tesseract succeeded.")
-                    return [{"text": text}]
-            except Exception as exc:  # pragma: no cover - pytesseract runtime errors
-                logger.error("❌ All OCR engines failed: {}", exc)
+                logger.info("▶️ Running EasyOCR batch of {} at {}x{}", len(indices), width, height)
+                with _inference_mode(self.half):
+                    results = self.easy.readtext_batched(
+                        [images[i] for i in indices],
+                        n_width=width,
+                        n_height=height,
+                        batch_size=_EASY_BATCH_SIZE,
+                        detail=0,
+                    )
+            except Exception as exc:  # pragma: no cover - EasyOCR runtime errors
+                logger.warning("⚠️ EasyOCR batch failed: {}", exc)
+                continue
+            for idx, blocks in zip(indices, results):
+                if blocks:
+                    texts[idx] = "\n".join(blocks)
+        return texts
 
-        logger.error("❌ OCR cascade produced empty result.")
-        return [{"text": ""}]
+    def run_batch(self, image_paths: Sequence[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Run the cascade over several images, batching the EasyOCR stage.
+
+        Blank and cached images are returned directly.  PaddleOCR runs per image; the
+        images it cannot read go to EasyOCR in size buckets, and whatever is
+        still empty falls back to Tesseract on a bounded thread pool.
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(image_paths)
+        keys: List[Optional[str]] = [None] * len(image_paths)
+        for idx, path in enumerate(image_paths):
+            if self._is_blank(path):
+                results[idx] = [{"text": ""}]
+                continue
+            if self._cache_size > 0:
+                try:
+                    keys[idx] = file_utils.compute_hash(path, _CACHE_HASH, block_size=1 << 20)
+                except OSError as exc:
+                    logger.warning("⚠️ Could not hash {}: {}", path, exc)
+                if keys[idx] is not None:
+                    results[idx] = self._cache_get(keys[idx])
+
+        pending = [idx for idx, result in enumerate(results) if result is None]
+        images = {idx: self._load_image(image_paths[idx]) for idx in pending}
+        texts: Dict[int, str] = {}
+        with self._engine_lock:
+            for idx in pending:
+                image = images[idx]
+                text = self._run_paddle(image if image is not None else image_paths[idx], image_paths[idx])
+                if text is not None:
+                    texts[idx] = text
+            easy_inputs = {idx: images[idx] for idx in pending if idx not in texts and images[idx] is not None}
+            if easy_inputs:
+                texts.update(self._run_easy_batched(easy_inputs))
+
+        leftovers = [idx for idx in pending if idx not in texts]
+        if leftovers:
+            leftover_texts = self._tesseract_many([(images[i], image_paths[i]) for i in leftovers])
+            texts.update({idx: text for idx, text in zip(leftovers, leftover_texts) if text is not None})
+
+        for idx in pending:
+            text = texts.get(idx)
+            if text is None:
+                logger.error("❌ OCR cascade produced empty result for {}.", image_paths[idx])
+                results[idx] = [{"text": ""}]
+                continue
+            results[idx] = [{"text": text}]
+            if keys[idx] is not None:
+                self._cache_put(keys[idx], results[idx])
+        return results  # type: ignore[return-value]
+
+    def _tesseract_many(
+        self, items: Sequence[Tuple[Optional[np.ndarray], str]], concurrency: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Run Tesseract over ``items`` on a bounded thread pool (each call is its own process)."""
+        if concurrency is None:
+            concurrency = int(os.getenv("OCR_CONCURRENCY", os.cpu_count() or 1))
+        workers = max(1, min(concurrency, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="MultiOCR-tesseract") as pool:
+            return list(pool.map(lambda item: self._run_tesseract(*item), items))
+
+
+_STOP = object()
+
+
+class MultiOCRPipeline:
+    """
+    Stream many images through a :class:`MultiOCR` with overlapping stages.
+
+    Disk reads, hashing and decoding run on an I/O thread pool; a single
+    engine thread collects decoded images into batches (up to
+    ``max_batch_size`` or whatever arrived within ``max_wait`` seconds) and
+    runs PaddleOCR and batched EasyOCR on them; the calling thread finishes
+    each image (Tesseract fallback, cache update).  Stages are joined by
+    bounded queues so the engine keeps working while the next pages load.
+    """
+
+    def __init__(
+        self,
+        ocr: MultiOCR,
+        io_workers: int = 4,
+        max_batch_size: int = 8,
+        max_wait: float = 0.05,
+    ) -> None:
+        self.ocr = ocr
+        self.io_workers = max(1, io_workers)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+
+    def _load(self, idx: int, path: str) -> Tuple[int, str, Optional[str], Optional[np.ndarray], Optional[List[Dict[str, Any]]]]:
+        if self.ocr._is_blank(path):
+            return idx, path, None, None, [{"text": ""}]
+        key = None
+        if self.ocr._cache_size > 0:
+            try:
+                key = file_utils.compute_hash(path, _CACHE_HASH, block_size=1 << 20)
+            except OSError as exc:
+                logger.warning("⚠️ Could not hash {}: {}", path, exc)
+            if key is not None:
+                cached = self.ocr._cache_get(key)
+                if cached is not None:
+                    return idx, path, key, None, cached
+        return idx, path, key, self.ocr._load_image(path), None
+
+    def _collect_batch(self, source: "queue.Queue") -> List[Any]:
+        """Block for one item, then gather more until the batch is full or ``max_wait`` elapses."""
+        batch = [source.get()]
+        deadline = time.monotonic() + self.max_wait
+        while batch[-1] is not _STOP and len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(source.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _engine_stage(self, decoded: "queue.Queue", finished: "queue.Queue") -> None:
+        ocr = self.ocr
+        while True:
+            batch = self._collect_batch(decoded)
+            stop = batch[-1] is _STOP
+            items = [item for item in batch if item is not _STOP]
+            texts: Dict[int, str] = {}
+            try:
+                with ocr._engine_lock:
+                    for idx, path, _key, image, cached in items:
+                        if cached is None:
+                            text = ocr._run_paddle(image if image is not None else path, path)
+                            if text is not None:
+                                texts[idx] = text
+                    easy_inputs = {
+                        idx: image
+                        for idx, _path, _key, image, cached in items
+                        if cached is None and idx not in texts and image is not None
+                    }
+                    if easy_inputs:
+                        texts.update(ocr._run_easy_batched(easy_inputs))
+            except Exception as exc:  # pragma: no cover - keep the pipeline draining
+                logger.warning("⚠️ OCR engine stage failed: {}", exc)
+            for item in items:
+                finished.put((item, texts.get(item[0])))
+            if stop:
+                finished.put(_STOP)
+                return
+
+    def process(self, image_paths: Sequence[str]) -> List[List[Dict[str, Any]]]:
+        """Run every image through the staged pipeline; results keep input order."""
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(image_paths)
+        decoded: queue.Queue = queue.Queue(maxsize=2 * self.max_batch_size)
+        finished: queue.Queue = queue.Queue()
+
+        engine = threading.Thread(target=self._engine_stage, args=(decoded, finished), name="MultiOCR-engine", daemon=True)
+        engine.start()
+
+        def _feed() -> None:
+            try:
+                with ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="MultiOCR-io") as pool:
+                    for item in pool.map(self._load, range(len(image_paths)), image_paths):
+                        decoded.put(item)
+            finally:
+                decoded.put(_STOP)
+
+        feeder = threading.Thread(target=_feed, name="MultiOCR-feed", daemon=True)
+        feeder.start()
+
+        while True:
+            entry = finished.get()
+            if entry is _STOP:
+                break
+            (idx, path, key, image, cached), text = entry
+            if cached is not None:
+                results[idx] = cached
+                continue
+            if text is None:
+                text = self.ocr._run_tesseract(image, path)
+            if text is None:
+                logger.error("❌ OCR cascade produced empty result for {}.", path)
+                results[idx] = [{"text": ""}]
+                continue
+            results[idx] = [{"text": text}]
+            if key is not None:
+                self.ocr._cache_put(key, results[idx])
+
+        feeder.join()
+        engine.join()
+        return [result if result is not None else [{"text": ""}] for result in results]
 
 
-__all__ = ["MultiOCR"]
+__all__ = ["MultiOCR", "MultiOCRPipeline", "get_easy_reader", "mps_available"]
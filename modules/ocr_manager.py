@@ -8,29 +8,40 @@ GPU-capable fallback.  Fusion strategies are delegated to ``FusionManager``.
 
 from __future__ import annotations
 
+import hashlib
+import importlib
+import json
 import logging
 import os
+import queue
 import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from loguru import logger as loguru_logger
-from PIL import Image
+from PIL import Image, ImageDraw
 import cv2
 
 from .lang_map import map_code, map_codes
 from .paddle_models import ensure_ppocrv4_models
 from .engines import SuryaOCREngine, OCREngine
-from .image_utils import detect_handwriting_probability, enhance_image, deskew_image, denoise_image
+from .image_utils import (
+    denoise_image,
+    detect_handwriting_probability,
+    enhance_image,
+    estimate_noise,
+    estimate_skew_angle,
+)
 from .paddle_singleton import get_ppstructure_v3_instance
 
-try:
-    from pdf2image import convert_from_path  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    convert_from_path = None  # type: ignore
-
 # Windows-specific DLL handling for PyTorch/PaddleOCR
 if os.name == "nt":
     try:
@@ -49,48 +60,97 @@ if os.name == "nt":
     except Exception:
         pass
 
-# Selective backends for OCR engines are loaded lazily via get_paddle_ocr() singleton.
-# However, we need top-level imports for device detection methods below.
-try:
-    from paddleocr import PaddleOCR  # type: ignore
-except (ImportError, OSError):
-    PaddleOCR = None
-
-try:
-    import paddle  # type: ignore
-except (ImportError, OSError):
-    paddle = None
-
-try:
-    import easyocr  # type: ignore
-except (ImportError, OSError):
-    easyocr = None
-
-try:
-    import torch  # type: ignore
-except (ImportError, OSError):
-    torch = None
-
-try:
-    from pdf2image import convert_from_path  # type: ignore
+# The OCR backends (paddleocr, paddle, easyocr, torch) and pdf2image are
+# imported on first use through _optional_import: importing them costs
+# seconds, and most runs need only some of them.
+_OPTIONAL_MODULES: Dict[str, Any] = {}
+
+
+def _optional_import(name: str) -> Any:
+    """Import ``name`` once and cache it; ``None`` if it is missing or fails to load."""
+    if name not in _OPTIONAL_MODULES:
+        try:
+            _OPTIONAL_MODULES[name] = importlib.import_module(name)
+        except (ImportError, OSError):
+            _OPTIONAL_MODULES[name] = None
+    return _OPTIONAL_MODULES[name]
+
+try:  # pragma: no cover - optional dependency
+    import xxhash  # type: ignore
 except ImportError:
-    convert_from_path = None
+    xxhash = None
 
 
 DEFAULT_LANGUAGES: Tuple[str, ...] = ("spa", "eng")
 _LOGGER = logging.getLogger(__name__)
 
-_PADDLE_SINGLETON: Optional["PaddleOCR"] = None
-_PADDLE_CONFIG: Dict[str, Any] | None = None
-
-
-def get_paddle_ocr(lang: str, use_gpu: bool, gpu_id: int = 0, **kwargs: Any) -> Optional["PaddleOCR"]:
+# Content routing: pages are classified on a copy whose long edge is at most
+# this many pixels; a table needs this many strong horizontal/vertical rules.
+_ROUTING_MAX_SIDE = 512
+_TABLE_MIN_ROWS = 5
+_TABLE_MIN_COLS = 3
+
+# End-of-document marker for the page preparation queue.
+_STOP = object()
+# Prepared pages allowed to wait for OCR on top of those being preprocessed
+# (one per core); fixed so the backlog does not grow with the core count.
+_MAX_PREPARED_AHEAD = 4
+
+# A page as handed to the engines: a PIL image, or the RGB array produced by
+# _preprocess_image (engines read either through _pil_rgb_view).
+_PageImage = Union[Image.Image, np.ndarray]
+
+# PDF pages rasterised per pdf2image call; bounds memory for long documents.
+_PDF_CHUNK_PAGES = 16
+# The first chunk is smaller so preprocessing and OCR start while the rest renders.
+_PDF_FIRST_CHUNK_PAGES = 4
+
+# EasyOCR inputs are padded to multiples of this so cuDNN sees recurring shapes.
+_EASY_SHAPE_MULTIPLE = 32
+
+# preprocessing.denoise_mode -> denoise_image strength; "auto" runs the
+# bilateral filter only on pages at least this noisy (see estimate_noise).
+_DENOISE_STRENGTHS = {"bilateral": "normal", "median": "median", "nlmeans": "high"}
+_DENOISE_MIN_NOISE = 3.0
+# preprocessing.interp values for the upscale/deskew warp.
+_WARP_INTERPOLATION = {"linear": cv2.INTER_LINEAR, "cubic": cv2.INTER_CUBIC, "lanczos": cv2.INTER_LANCZOS4}
+
+# A page whose empty primary result is not retried: mean gray level above
+# this and handwriting probability below that.
+_BLANK_MIN_MEAN = 240.0
+_BLANK_MAX_HW_PROB = 0.3
+
+# Default Paddle recogniser batch (rec_batch_num) per device; see OCRConfig.
+_PADDLE_REC_BATCH_GPU = 6
+_PADDLE_REC_BATCH_CPU = 2
+
+# Preprocessed pages kept in memory per manager (see _preprocess_image).
+_PREP_CACHE_SIZE = 32
+
+# Clean-page probe: pages whose thumbnail Laplacian variance reaches this are
+# crisp enough to skip preprocessing (see _looks_clean).
+_SHARP_PROBE_SIDE = 256
+_SHARP_MIN_LAPLACIAN_VAR = 200.0
+
+# Deskew probe: on a copy downsampled to this long edge, ink rows whose
+# sums vary by more than this coefficient of variation mean the text lines
+# are already horizontal, so the skew estimate is skipped.
+_ALIGNED_PROBE_SIDE = 256
+_ALIGNED_ROW_CV = 0.6
+# Skew angles remembered per page content (batch retries re-OCR the same pages).
+_SKEW_CACHE_SIZE = 64
+
+# One PaddleOCR per (lang, gpu_id or -1, frozen constructor params).
+_PADDLE_SINGLETON_MAP: Dict[Tuple[Any, ...], Any] = {}
+_PADDLE_SINGLETON_LOCK = threading.Lock()
+
+
+def get_paddle_ocr(lang: str, use_gpu: bool, gpu_id: int = 0, **kwargs: Any) -> Optional[Any]:
     """
     Lazily create and reuse a single PaddleOCR instance per process.
     Compatible with PaddleOCR >=3.2 (use_cuda instead of use_gpu, show_log removed).
     """
-    global _PADDLE_SINGLETON, _PADDLE_CONFIG
-
+    PaddleOCR = getattr(_optional_import("paddleocr"), "PaddleOCR", None)
     if PaddleOCR is None:
         return None
 
@@ -112,24 +172,38 @@ def get_paddle_ocr(lang: str, use_gpu: bool, gpu_id: int = 0, **kwargs: Any) ->
 
     # For multi-GPU, we can't use a single global singleton easily if they need different GPUs
     # However, if it's the SAME GPU_ID, we can reuse.
-    # We'll use a dictionary of singletons keyed by (lang, gpu_id)
-    global _PADDLE_SINGLETON_MAP
-    if "_PADDLE_SINGLETON_MAP" not in globals():
-        globals()["_PADDLE_SINGLETON_MAP"] = {}
-
-    key = (lang, gpu_id if requested_cuda else -1)
-    
-    if key not in globals()["_PADDLE_SINGLETON_MAP"]:
+    # We'll use a dictionary of singletons keyed by (lang, gpu_id) and the
+    # remaining constructor params, so identical call-sites share one instance.
+    key = (lang, gpu_id if requested_cuda else -1, _freeze_params(params))
+
+    # Lock-free fast path; the lock only guards construction so two threads
+    # can never load the (GPU-resident) weights twice.
+    instance = _PADDLE_SINGLETON_MAP.get(key)
+    if instance is not None:
+        return instance
+    with _PADDLE_SINGLETON_LOCK:
+        instance = _PADDLE_SINGLETON_MAP.get(key)
+        if instance is None:
+            try:
+                instance = PaddleOCR(**params)
+                _PADDLE_SINGLETON_MAP[key] = instance
+                _LOGGER.info(f"PaddleOCR loaded successfully for {key[:2]}.")
+            except Exception as exc:
+                _LOGGER.error(f"Failed to initialise PaddleOCR for {key[:2]}: {exc}")
+                return None
+    return instance
+
+
+def _freeze_params(params: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Hashable, order-independent view of PaddleOCR constructor params."""
+    frozen = []
+    for name, value in sorted(params.items()):
         try:
-            instance = PaddleOCR(**params)
-            globals()["_PADDLE_SINGLETON_MAP"][key] = instance
-            _LOGGER.info(f"PaddleOCR loaded successfully for {key}.")
-        except Exception as exc:
-            _LOGGER.error(f"Failed to initialise PaddleOCR for {key}: {exc}")
-            return None
-    
-    return globals()["_PADDLE_SINGLETON_MAP"][key]
-
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        frozen.append((name, value))
+    return tuple(frozen)
 
 
 def ocr_text_to_markdown(text: str) -> str:
@@ -138,8 +212,11 @@ def ocr_text_to_markdown(text: str) -> str:
     """
     if not text:
         return ""
+    return _lines_to_markdown(text.splitlines())
 
-    lines = text.splitlines()
+
+def _lines_to_markdown(lines: Iterable[str]) -> str:
+    """Markdown for OCR ``lines`` (see :func:`ocr_text_to_markdown`), consumed in one pass."""
     markdown_lines: List[str] = []
     paragraph: List[str] = []
 
@@ -165,25 +242,73 @@ def ocr_text_to_markdown(text: str) -> str:
     if paragraph:
         markdown_lines.append(_normalise_whitespace(" ".join(paragraph)))
 
-    markdown = "\n".join(markdown_lines)
-    markdown = re.sub(r"\n{3,}", "\n\n", markdown)
-    return markdown.strip()
+    # A blank line is only ever appended right after a paragraph or heading,
+    # so the output never holds runs of 3+ newlines and needs no collapse pass.
+    return "\n".join(markdown_lines).strip()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OCRConfig:
-    """Configuration options for :class:`OCRManager`."""
+    """
+    Configuration options for :class:`OCRManager`.
+
+    Immutable once built: ``languages`` is frozen to a tuple (falling back to
+    ``DEFAULT_LANGUAGES`` when empty), engine names are lower-cased, and
+    ``engine_configs`` keys are lower-cased into a read-only mapping, so a
+    manager can read them directly without copying.
+
+    ``engine_configs["paddleocr"]["rec_batch_num"]`` sets how many text-line
+    crops the Paddle recogniser takes per call.  Larger batches help GPUs,
+    especially with pages predicted together, but on CPU Paddle preallocates
+    memory arenas in proportion to it for little throughput gain; when unset
+    it is ``_PADDLE_REC_BATCH_GPU`` on GPU and ``_PADDLE_REC_BATCH_CPU`` on CPU.
+    """
 
     enabled: bool = True
-    languages: Sequence[str] = DEFAULT_LANGUAGES
+    languages: Tuple[str, ...] = DEFAULT_LANGUAGES
     primary_engine: str = "paddleocr"
     secondary_engine: str = "easyocr"
     fusion_strategy: str = "levenshtein"
     min_confidence_primary: float = 0.6
     confidence_margin: float = 0.05
     min_similarity: float = 0.82
-    engine_configs: Dict[str, Dict[str, object]] = field(default_factory=dict)
-    preprocessing: Dict[str, Any] = field(default_factory=dict)
+    engine_configs: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    preprocessing: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    def __post_init__(self) -> None:
+        freeze = object.__setattr__  # frozen dataclass: normalise once, here
+        freeze(self, "languages", tuple(self.languages) if self.languages else DEFAULT_LANGUAGES)
+        freeze(self, "primary_engine", self.primary_engine.lower())
+        freeze(self, "secondary_engine", self.secondary_engine.lower())
+        freeze(self, "engine_configs", MappingProxyType(
+            {str(key).lower(): value for key, value in (self.engine_configs or {}).items()}
+        ))
+        freeze(self, "preprocessing", MappingProxyType(dict(self.preprocessing or {})))
+
+
+@dataclass
+class PageFeatures:
+    """
+    Per-page analysis shared by preprocessing and engine routing.
+
+    The page is converted to grayscale once; ``gray_small`` (long edge at
+    most ``_ROUTING_MAX_SIDE``) feeds the cheap whole-page probes.
+    """
+
+    gray_full: np.ndarray
+    gray_small: np.ndarray
+    hw_prob: float
+    skew_angle: float
+    content_type: Optional[str] = None
+
+
+@dataclass
+class OCRPage:
+    """Recognised text of one page with its confidence and handwriting score."""
+
+    text: str
+    confidence: float
+    handwriting_prob: float
 
 
 class OCRManager:
@@ -202,12 +327,10 @@ class OCRManager:
         self.enabled = self.config.enabled
         self.gpu_id = gpu_id
 
-        self.engine_configs: Dict[str, Dict[str, object]] = {
-            key.lower(): value for key, value in (self.config.engine_configs or {}).items()
-        }
-        self.primary_engine = self.config.primary_engine.lower()
-        self.secondary_engine = self.config.secondary_engine.lower()
-        self.languages = tuple(self.config.languages) if self.config.languages else DEFAULT_LANGUAGES
+        self.engine_configs = self.config.engine_configs
+        self.primary_engine = self.config.primary_engine
+        self.secondary_engine = self.config.secondary_engine
+        self.languages = self.config.languages
         self.poppler_path = self.engine_configs.get("poppler_path")
 
         paddle_conf = self.engine_configs.get("paddleocr", {})
@@ -215,6 +338,12 @@ class OCRManager:
 
         self._paddle_enabled = bool(paddle_conf.get("enabled", True))
         self._easy_enabled = bool(easy_conf.get("enabled", True))
+        self._easy_batch_size = int(easy_conf.get("batch_size", 8))
+        self._easy_backend = str(easy_conf.get("backend", "torch")).lower()
+        self._easy_onnx_dir = str(easy_conf.get("onnx_dir", os.path.join("models", "easyocr_onnx")))
+        self._easy_tensorrt = bool(easy_conf.get("tensorrt", False))
+        self._easy_precision = str(easy_conf.get("precision", "fp32")).lower()
+        self._easy_calibration_dir = easy_conf.get("calibration_dir")
 
         self._paddle_use_gpu = (
             self._determine_paddle_gpu(bool(paddle_conf.get("gpu", True))) if self._paddle_enabled else False
@@ -234,14 +363,45 @@ class OCRManager:
         self._paddle_auto_models = bool(paddle_conf.get("autodownload_models", True))
         self._paddle_model_dirs: Dict[str, str] = {}
         self._prepare_paddle_models(paddle_conf)
-
-        self._paddle_ocr: Optional[PaddleOCR] = None
+        self._paddle_options = self._paddle_hpi_options(paddle_conf)
+        self._paddle_options.update(self._paddle_int8_options(paddle_conf))
+        self._paddle_batch_size = int(paddle_conf.get("batch_size", 8))
+        self._paddle_warmup = bool(paddle_conf.get("warmup", True))
+        self._paddle_cudnn_exhaustive = bool(paddle_conf.get("cudnn_exhaustive_search", False))
+        self._easy_warmup = bool(easy_conf.get("warmup", True))
+        # Text-line crops per recogniser call (see OCRConfig); an explicit
+        # rec_batch_num always wins.
+        rec_batch_num = paddle_conf.get("rec_batch_num")
+        if rec_batch_num is None:
+            rec_batch_num = _PADDLE_REC_BATCH_GPU if self._paddle_use_gpu else _PADDLE_REC_BATCH_CPU
+        self._paddle_options["text_recognition_batch_size"] = int(rec_batch_num)
+
+        self._paddle_ocr: Optional[Any] = None
         self._easy_reader: Optional[object] = None
         self.extra_engines: Dict[str, OCREngine] = {}
+        # Per-thread conversion buffers reused across pages (see _pil_to_np).
+        self._scratch = threading.local()
+        self._skew_cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._skew_cache_lock = threading.Lock()
+        # Opt-in cache of preprocessed pages on disk plus a small LRU; see _preprocess_image.
+        pre_conf = self.config.preprocessing
+        self._prep_cache_dir: Optional[Path] = None
+        if pre_conf.get("cache", False):
+            self._prep_cache_dir = Path(str(pre_conf.get(
+                "cache_dir", os.path.join(os.path.dirname(self._paddle_model_storage), "cache", "prep")
+            )))
+        # OpenCL (T-API) offload of the warp, denoise and sharpen stages.
+        self._prep_opencl = bool(pre_conf.get("opencl", False)) and cv2.ocl.haveOpenCL()
+        if pre_conf.get("opencl", False) and not self._prep_opencl:
+            self.logger.info("OpenCL requested for preprocessing but no OpenCL device is available.")
+        self._prep_conf_key = json.dumps(dict(pre_conf), sort_keys=True, default=str).encode()
+        self._prep_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._prep_cache_lock = threading.Lock()
         
         self._initialise_paddle()
         self._initialise_easy()
         self._initialise_extra_engines()
+        self._warm_up_engines()
 
         if not self._paddle_ocr and not self._easy_reader:
             self.logger.error("OCR initialization failed: PaddleOCR is %s, EasyOCR is %s", 
@@ -263,40 +423,96 @@ class OCRManager:
         if not self.enabled:
             return "", None, 0.0, False
 
-        images = self._load_document_images(file_path)
-        page_texts: List[str] = []
-        confidences: List[float] = []
-        is_handwritten_scores: List[float] = []
+        text, _markdown, language, confidence, is_handwritten = self._finalize(
+            self._extract_pages(file_path, min_confidence)
+        )
+        return text, language, confidence, is_handwritten
 
-        for image in images:
-            # Check handwriting first on original image
-            hw_prob = detect_handwriting_probability(image)
-            is_handwritten_scores.append(hw_prob)
+    def _extract_pages(self, file_path: str, min_confidence: Optional[float] = None) -> List[OCRPage]:
+        """OCR every page of ``file_path`` (primary engine, then secondary for weak pages)."""
+        threshold = min_confidence if min_confidence is not None else self.config.min_confidence_primary
 
-            #  Preprocess image for better accuracy
-            processed_image = self._preprocess_image(image)
-            
-            text, confidence = self._run_primary_engine(processed_image)
-            if (
-                self.secondary_engine
-                and self.secondary_engine != self.primary_engine
-                and confidence < (min_confidence if min_confidence is not None else self.config.min_confidence_primary)
-            ):
-                secondary_text, secondary_conf = self._run_secondary_engine(image)
-                if secondary_text and secondary_conf > confidence:
-                    text, confidence = secondary_text, secondary_conf
-
-            page_texts.append(text)
-            confidences.append(confidence)
-
-        aggregated_text = "\n".join(part for part in page_texts if part).strip()
-        aggregated_conf = float(np.mean(confidences)) if confidences else 0.0
+        # Originals are kept only for pages that will get a secondary pass.
+        images: Dict[int, Image.Image] = {}
+        is_handwritten_scores: List[float] = []
+        blank_pages: List[bool] = []
+        page_results: List[Tuple[str, float]] = []
+        batch_primary = self._primary_batch_runner()
+        pending: List[_PageImage] = []
+
+        # Pages clearly below the confidence threshold get one batched secondary
+        # pass; pages within confidence_margin of it, and empty results on
+        # blank pages, are not worth a second engine.
+        retry: List[int] = []
+        use_secondary = bool(self.secondary_engine and self.secondary_engine != self.primary_engine)
+        margin = self.config.confidence_margin
+
+        def _settle(start: int) -> None:
+            for idx in range(start, len(page_results)):
+                text, confidence = page_results[idx]
+                if use_secondary and (confidence + margin < threshold if text else not blank_pages[idx]):
+                    retry.append(idx)
+                else:
+                    del images[idx]
+
+        # Recognition runs here while later pages are still being rasterised
+        # and preprocessed in the background (see _iter_prepared_pages).
+        for image, features, processed in self._iter_prepared_pages(file_path):
+            images[len(blank_pages)] = image
+            is_handwritten_scores.append(features.hw_prob)
+            blank_pages.append(_looks_blank(features))
+            settled = len(page_results)
+            if batch_primary is None:
+                page_results.append(self._run_primary_engine(processed, features))
+            else:
+                run_batch, batch_size = batch_primary
+                pending.append(processed)
+                if len(pending) >= batch_size:
+                    page_results.extend(run_batch(pending))
+                    pending = []
+            _settle(settled)
+        if pending:
+            settled = len(page_results)
+            page_results.extend(batch_primary[0](pending))
+            _settle(settled)
+
+        if retry:
+            if self._secondary_is_easy():
+                secondary_results = self._run_easy_batch([images[idx] for idx in retry])
+            else:
+                secondary_results = [self._run_secondary_engine(images[idx]) for idx in retry]
+            for idx, (secondary_text, secondary_conf) in zip(retry, secondary_results):
+                if secondary_text and secondary_conf > page_results[idx][1]:
+                    page_results[idx] = (secondary_text, secondary_conf)
+
+        return [
+            OCRPage(text=text, confidence=conf, handwriting_prob=hw_prob)
+            for (text, conf), hw_prob in zip(page_results, is_handwritten_scores)
+        ]
+
+    def _finalize(
+        self, pages: Sequence[OCRPage], markdown: bool = False
+    ) -> Tuple[str, str, Optional[str], float, bool]:
+        """
+        Aggregate ``pages`` into ``(text, markdown, language, confidence, is_handwritten)``.
+
+        The Markdown (only built when requested) is produced from the page
+        lines directly instead of re-splitting the joined document text.
+        """
+        page_texts = [page.text for page in pages if page.text]
+        aggregated_text = "\n".join(page_texts).strip()
+        aggregated_markdown = ""
+        if markdown and aggregated_text:
+            aggregated_markdown = _lines_to_markdown(
+                line for page_text in page_texts for line in page_text.splitlines()
+            )
+        aggregated_conf = float(np.mean([page.confidence for page in pages])) if pages else 0.0
         
         # Aggregate handwriting probability (max score across pages)
-        is_handwritten = max(is_handwritten_scores) > 0.5 if is_handwritten_scores else False
+        is_handwritten = max(page.handwriting_prob for page in pages) > 0.5 if pages else False
         
         language = self.languages[0] if aggregated_text else None
-        return aggregated_text, language, aggregated_conf, is_handwritten
+        return aggregated_text, aggregated_markdown, language, aggregated_conf, is_handwritten
 
     def extract_text_with_markdown(
         self,
@@ -306,9 +522,9 @@ class OCRManager:
         Extract text and convert it to Markdown, returning both representations.
         Returns: (text, markdown, language, confidence, is_handwritten)
         """
-        text, language, confidence, is_handwritten = self.extract_text(file_path)
-        markdown = ocr_text_to_markdown(text) if text else ""
-        return text, markdown, language, confidence, is_handwritten
+        if not self.enabled:
+            return "", "", None, 0.0, False
+        return self._finalize(self._extract_pages(file_path), markdown=True)
 
     def extract_block(
         self,
@@ -341,12 +557,95 @@ class OCRManager:
     # Internal helpers
     # ------------------------------------------------------------------ #
 
-    def _run_primary_engine(self, image: Image.Image) -> Tuple[str, float]:
+    def _iter_prepared_pages(self, file_path: str) -> Iterator[Tuple[Image.Image, PageFeatures, np.ndarray]]:
+        """
+        Yield :meth:`_prepare_page` results for ``file_path`` in page order.
+
+        A feeder thread rasterises pages and hands them to a thread pool
+        (handwriting detection and preprocessing are OpenCV-bound and release
+        the GIL), so the caller can run OCR on page ``n`` while later pages are
+        prepared.  The pool has one worker per core; the queue admits those
+        plus ``_MAX_PREPARED_AHEAD`` finished pages, which provides
+        backpressure for long PDFs.
+        """
+        workers = os.cpu_count() or 1
+        in_flight: "queue.Queue[Any]" = queue.Queue(maxsize=workers + _MAX_PREPARED_AHEAD)
+        cancelled = threading.Event()
+
+        def _put(item: Any) -> bool:
+            while not cancelled.is_set():
+                try:
+                    in_flight.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-prepare") as pool:
+
+            def _feed() -> None:
+                try:
+                    for image in self._load_document_images(file_path):
+                        if not _put(pool.submit(self._prepare_page, image)):
+                            return
+                except Exception as exc:
+                    _put(exc)
+                finally:
+                    _put(_STOP)
+
+            feeder = threading.Thread(target=_feed, name="ocr-rasterise", daemon=True)
+            feeder.start()
+            try:
+                while True:
+                    item = in_flight.get()
+                    if item is _STOP:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item.result()
+            finally:
+                cancelled.set()
+                feeder.join()
+
+    def _prepare_page(self, image: Image.Image) -> Tuple[Image.Image, PageFeatures, np.ndarray]:
+        """Return ``(original, features, preprocessed)`` for one page."""
+        features = self._compute_page_features(image)
+        return image, features, self._preprocess_image(image, features)
+
+    def _compute_page_features(self, image: Image.Image) -> PageFeatures:
+        """Run the page-level probes off a single grayscale conversion of ``image``."""
+        gray = cv2.cvtColor(_pil_rgb_view(image), cv2.COLOR_RGB2GRAY)
+        gray_small = _downsample(gray, _ROUTING_MAX_SIDE)
+        return PageFeatures(
+            gray_full=gray,
+            gray_small=gray_small,
+            # Stroke solidity needs full-resolution glyphs.
+            hw_prob=detect_handwriting_probability(gray),
+            skew_angle=self._skew_angle(gray, gray_small),
+            content_type=self._classify_content(gray_small) if self.primary_engine == "auto" else None,
+        )
+
+    def _primary_batch_runner(
+        self,
+    ) -> Optional[Tuple[Callable[[Sequence[_PageImage]], List[Tuple[str, float]]], int]]:
+        """Batch callable and size for the primary engine, or ``None`` to run pages one by one."""
+        if self.primary_engine == "easyocr" and self._easy_reader:
+            return self._run_easy_batch, self._easy_batch_size
+        if self.primary_engine == "paddleocr" and self._paddle_ocr:
+            return self._run_paddle_batch, self._paddle_batch_size
+        return None
+
+    def _run_primary_engine(
+        self, image: _PageImage, features: Optional[PageFeatures] = None
+    ) -> Tuple[str, float]:
         engine_to_use = self.primary_engine
 
         # Smart Routing Logic
         if engine_to_use == "auto":
-            analysis = self._analyze_image_content(image)
+            if features is not None and features.content_type is not None:
+                analysis = features.content_type
+            else:
+                analysis = self._analyze_image_content(image)
             if analysis == "table":
                 # Tables -> Prefer Surya > Paddle > Easy
                 if "surya" in self.extra_engines:
@@ -367,6 +666,8 @@ class OCRManager:
             self.logger.debug(f"🤖 Smart Routing: Content='{analysis}' -> Selected Engine='{engine_to_use}'")
 
         if engine_to_use == "surya" and "surya" in self.extra_engines:
+             if isinstance(image, np.ndarray):
+                 image = Image.fromarray(image)
              return self.extra_engines["surya"].extract_text(image)
 
         if engine_to_use == "paddleocr" and self._paddle_ocr:
@@ -383,7 +684,7 @@ class OCRManager:
             return self._run_easy(image)
         return "", 0.0
 
-    def _run_secondary_engine(self, image: Image.Image) -> Tuple[str, float]:
+    def _run_secondary_engine(self, image: _PageImage) -> Tuple[str, float]:
         if self.secondary_engine == "easyocr" and self._easy_reader:
             return self._run_easy(image)
         if self.secondary_engine == "paddleocr" and self._paddle_ocr:
@@ -394,96 +695,254 @@ class OCRManager:
             return self._run_paddle(image)
         return "", 0.0
 
-    def _run_paddle(self, image: Image.Image) -> Tuple[str, float]:
+    def _run_paddle(self, image: _PageImage) -> Tuple[str, float]:
+        return self._run_paddle_batch([image])[0]
+
+    def _run_paddle_batch(self, images: Sequence[_PageImage]) -> List[Tuple[str, float]]:
+        """
+        Recognise pages with one PPStructureV3 ``predict`` call.
+
+        Layout and detection still run page by page inside Paddle, but the
+        recogniser batches text-line crops across pages
+        (``engine_configs.paddleocr.rec_batch_num``) and the pages cross the
+        Python/C++ boundary once.  Single pages take the same route so every
+        result goes through :meth:`_paddle_result_to_text`; a failed batch is
+        retried one page at a time.
+        """
         if not self._paddle_ocr:
-            return "", 0.0
+            return [("", 0.0)] * len(images)
+
+        paddle = self._paddle_ocr
+        predict = getattr(paddle, "predict", None)
+        if predict is None:
+            # Pipelines without ``predict`` are plain callables taking one page.
+            def predict(arrays: List[np.ndarray]) -> List[Any]:
+                return [paddle(array) for array in arrays]
 
-        array = self._pil_to_np(image)
+        # _pil_to_np reuses one scratch buffer per thread, so copy each page.
+        arrays = [cv2.cvtColor(_pil_rgb_view(image), cv2.COLOR_RGB2BGR) for image in images]
         try:
-            # PPStructureV3 returns a list of dictionaries (one for each detected block)
-            # We extract text from all blocks to provide a full page representation.
-            results = self._paddle_ocr(array)
+            results = list(predict(arrays))
         except Exception as exc:  # pragma: no cover - Paddle runtime errors
-            self.logger.error("PaddleOCR (PPStructureV3) failed: %s", exc)
-            return "", 0.0
+            if len(images) == 1:
+                self.logger.error("PaddleOCR (PPStructureV3) failed: %s", exc)
+                return [("", 0.0)]
+            self.logger.warning("PaddleOCR batch failed (%s); running pages individually.", exc)
+            return [self._run_paddle(image) for image in images]
+        if len(results) != len(images):
+            self.logger.warning(
+                "PaddleOCR returned %d results for %d pages; running pages individually.",
+                len(results), len(images),
+            )
+            if len(images) == 1:
+                return [("", 0.0)]
+            return [self._run_paddle(image) for image in images]
+        return [self._paddle_result_to_text(result) for result in results]
 
-        texts: List[str] = []
-        confidences: List[float] = []
+    @staticmethod
+    def _paddle_result_to_text(results: Any) -> Tuple[str, float]:
+        """
+        Join the recognised lines of one page result.
 
+        Accepts the structure pipeline's list of layout blocks and the
+        per-page result of ``PPStructureV3.predict`` (a mapping whose
+        ``overall_ocr_res`` holds ``rec_texts``/``rec_scores``).
+        """
         if not results:
             return "", 0.0
 
-        for block in results:
-            # Structural blocks have a 'res' key containing detection/recognition results
-            res = block.get("res")
-            if not res or not isinstance(res, list):
-                continue
-            
-            # Format depends on block type, but for text/table it's usually a list of lines
-            for item in res:
-                if not isinstance(item, (list, tuple)) or len(item) != 2:
-                    continue
-                # item format: [box, (text, score)]
-                data = item[1]
-                if not isinstance(data, (list, tuple)) or not data:
-                    continue
-                
-                text = (str(data[0]) or "").strip()
-                conf = float(data[1]) if len(data) > 1 and data[1] is not None else 0.0
-                if text:
-                    texts.append(text)
-                    confidences.append(conf)
-
-        if not texts:
-            return "", 0.0
-        avg_conf = float(np.mean(confidences)) if confidences else 0.0
-        return "\n".join(texts), avg_conf
+        if isinstance(results, Mapping):
+            ocr_res = results.get("overall_ocr_res") or {}
+            # rec_texts/rec_scores may be ndarrays, which have no truth value.
+            texts = [] if (t := ocr_res.get("rec_texts")) is None else list(t)
+            scores = [] if (s := ocr_res.get("rec_scores")) is None else list(s)
+            scores += [0.0] * (len(texts) - len(scores))
+            pairs = [
+                (text, float(score))
+                for raw, score in zip(texts, scores)
+                if (text := (str(raw) or "").strip())
+            ]
+        else:
+            # Structural blocks have a 'res' key holding [box, (text, score)] lines.
+            lines = [
+                item[1]
+                for block in results
+                if isinstance(res := block.get("res"), list)
+                for item in res
+                if isinstance(item, (list, tuple)) and len(item) == 2
+                and isinstance(item[1], (list, tuple)) and item[1]
+            ]
+            pairs = [
+                (text, float(data[1]) if len(data) > 1 and data[1] is not None else 0.0)
+                for data in lines
+                if (text := (str(data[0]) or "").strip())
+            ]
+        return _join_lines(pairs)
+
+    def _secondary_is_easy(self) -> bool:
+        """Whether :meth:`_run_secondary_engine` would dispatch to EasyOCR."""
+        if not self._easy_reader:
+            return False
+        if self.secondary_engine == "easyocr":
+            return True
+        return not (self.secondary_engine == "paddleocr" and self._paddle_ocr)
 
-    def _run_easy(self, image: Image.Image) -> Tuple[str, float]:
+    def _run_easy(self, image: _PageImage) -> Tuple[str, float]:
         if not self._easy_reader:
             return "", 0.0
 
-        array = np.array(image.convert("RGB"))
+        array = _pad_to_multiple(_pil_rgb_view(image), _EASY_SHAPE_MULTIPLE)
         try:
             result = self._easy_reader.readtext(array, detail=1)
         except Exception as exc:  # pragma: no cover - EasyOCR runtime errors
             self.logger.error("EasyOCR failed: %s", exc)
             return "", 0.0
 
-        texts: List[str] = []
-        confidences: List[float] = []
+        return self._easy_result_to_text(result)
 
-        for item in result:
-            if len(item) < 2:
-                continue
-            text = (item[1] or "").strip()
-            conf_value = float(item[2]) if len(item) > 2 and item[2] is not None else 0.0
-            if text:
-                texts.append(text)
-                confidences.append(conf_value)
+    def _run_easy_batch(self, images: Sequence[_PageImage]) -> List[Tuple[str, float]]:
+        """
+        Recognise several pages with one ``readtext_batched`` call.
 
-        if not texts:
-            return "", 0.0
-        avg_conf = float(np.mean(confidences)) if confidences else 0.0
-        return "\n".join(texts), avg_conf
+        Pages are padded with white on the bottom/right to the largest page
+        size (pages of one document are normally uniform), so detection and
+        recognition run as GPU batches instead of one page per Python round
+        trip, without stretching smaller pages.
+        """
+        if len(images) <= 1 or not hasattr(self._easy_reader, "readtext_batched"):
+            return [self._run_easy(image) for image in images]
+
+        arrays = [_pil_rgb_view(image) for image in images]
+        height = _round_up(max(array.shape[0] for array in arrays), _EASY_SHAPE_MULTIPLE)
+        width = _round_up(max(array.shape[1] for array in arrays), _EASY_SHAPE_MULTIPLE)
+        arrays = [_pad_to_shape(array, height, width) for array in arrays]
+        try:
+            results = self._easy_reader.readtext_batched(  # type: ignore[union-attr]
+                arrays,
+                n_width=width,
+                n_height=height,
+                batch_size=self._easy_batch_size,
+                detail=1,
+            )
+        except Exception as exc:  # pragma: no cover - EasyOCR runtime errors
+            self.logger.warning("EasyOCR batch failed (%s); running pages individually.", exc)
+            return [self._run_easy(image) for image in images]
+        return [self._easy_result_to_text(result) for result in results]
+
+    @staticmethod
+    def _easy_result_to_text(result: Iterable[Sequence[Any]]) -> Tuple[str, float]:
+        pairs = [
+            (text, float(item[2]) if len(item) > 2 and item[2] is not None else 0.0)
+            for item in result
+            if len(item) >= 2 and (text := (item[1] or "").strip())
+        ]
+        return _join_lines(pairs)
 
     def _initialise_paddle(self) -> None:
         if not self._paddle_enabled:
             return
         if self.primary_engine != "paddleocr" and self.secondary_engine != "paddleocr":
             return
+        paddle = _optional_import("paddle") if self._paddle_cudnn_exhaustive and self._paddle_use_gpu else None
+        if paddle is not None:
+            # Benchmark every cuDNN convolution algorithm once per input shape;
+            # worth it when page sizes repeat (uniform scans, batch runs).
+            try:
+                paddle.set_flags({"FLAGS_cudnn_exhaustive_search": True})
+            except Exception as exc:  # pragma: no cover - Paddle runtime errors
+                self.logger.debug("Could not enable cuDNN exhaustive search: %s", exc)
         try:
             # Strictly use PPStructureV3 from the singleton as requested.
             # No legacy hacks, no version detection, no direct use_gpu/gpu_id arguments.
-            self._paddle_ocr = get_ppstructure_v3_instance()
+            self._paddle_ocr = get_ppstructure_v3_instance(**self._paddle_options)
             if self._paddle_ocr is not None:
                 self.logger.info("PaddleOCR (PPStructureV3) initialised via singleton.")
+                if self._paddle_options.get("use_tensorrt"):
+                    self.logger.info(
+                        "PaddleOCR TensorRT execution requested (precision=%s).",
+                        self._paddle_options.get("precision"),
+                    )
+                if self._paddle_options.get("enable_hpi"):
+                    self.logger.info(
+                        "PaddleOCR high-performance inference requested (backend=%s, precision=%s).",
+                        self._paddle_options.get("hpi_config", {}).get("backend", "auto"),
+                        self._paddle_options.get("precision", "fp32"),
+                    )
                 if self._paddle_use_gpu:
                     loguru_logger.success("PaddleOCR (GPU) initialized successfully.")
         except Exception as exc:  # pragma: no cover - Paddle runtime errors
             self.logger.warning("Failed to initialise PaddleOCR: %s", exc)
             self._paddle_ocr = None
 
+    def _paddle_hpi_options(self, paddle_conf: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build PPStructureV3 acceleration options from ``engine_configs.paddleocr``:
+        ``enable_hpi`` (bool), ``hpi_backend`` (``auto``/``tensorrt``/
+        ``onnxruntime``/``openvino``), ``precision`` (``fp32``/``fp16``, GPU only) and
+        ``cpu_threads``.  High-performance inference lets PaddleOCR pick the
+        fastest installed backend per model.  A ``tensorrt`` block
+        (``enabled``, ``precision``) runs the models through TensorRT on GPU.
+        """
+        options: Dict[str, Any] = {}
+        trt_conf = paddle_conf.get("tensorrt") or {}
+        if isinstance(trt_conf, dict) and trt_conf.get("enabled", False) and self._paddle_use_gpu:
+            # Paddle Inference builds TensorRT subgraph engines for det/rec/layout
+            # on first use and caches them next to the models.
+            options["use_tensorrt"] = True
+            options["precision"] = str(trt_conf.get("precision", "fp16")).lower()
+        if not paddle_conf.get("enable_hpi", False):
+            return options
+        options["enable_hpi"] = True
+        backend = str(paddle_conf.get("hpi_backend", "auto")).lower()
+        if backend != "auto":
+            options["hpi_config"] = {"backend": backend}
+        # fp16 only pays off on GPU; CPU backends always run fp32.
+        precision = str(paddle_conf.get("precision", "fp16")).lower() if self._paddle_use_gpu else "fp32"
+        options.setdefault("precision", precision)
+        options["cpu_threads"] = int(paddle_conf.get("cpu_threads", os.cpu_count() or 1))
+        return options
+
+    def _paddle_int8_options(self, paddle_conf: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        INT8 recognition from ``engine_configs.paddleocr``: ``quantize: true``
+        with ``rec_quant_model_dir`` (and, for non-default architectures,
+        ``rec_quant_model_name``) pointing at a pre-quantised recognition
+        model, e.g. a PaddleSlim export of PP-OCRv4 rec.  On CPU the quantised
+        ops run through oneDNN as they are; on GPU INT8 kernels need TensorRT
+        (``tensorrt.enabled``) and tensor cores with INT8 support (compute
+        capability 7.5+), otherwise the configured precision is kept.
+        """
+        if not paddle_conf.get("quantize", False):
+            return {}
+        model_dir = paddle_conf.get("rec_quant_model_dir")
+        if not model_dir or not os.path.isdir(str(model_dir)):
+            self.logger.warning(
+                "PaddleOCR quantize requested but rec_quant_model_dir %r is missing; using the FP recogniser.",
+                model_dir,
+            )
+            return {}
+
+        options: Dict[str, Any] = {"text_recognition_model_dir": str(model_dir)}
+        if paddle_conf.get("rec_quant_model_name"):
+            options["text_recognition_model_name"] = str(paddle_conf["rec_quant_model_name"])
+        precision = "int8 (oneDNN)"
+        if self._paddle_use_gpu:
+            precision = self._paddle_options.get("precision", "fp32")
+            paddle = _optional_import("paddle")
+            try:
+                capability = tuple(paddle.device.cuda.get_device_capability(self.gpu_id)) if paddle else (0, 0)
+            except Exception:  # pragma: no cover - defensive
+                capability = (0, 0)
+            if self._paddle_options.get("use_tensorrt") and capability >= (7, 5):
+                options["precision"] = precision = "int8"
+            else:
+                self.logger.info(
+                    "INT8 recognition on GPU needs TensorRT and compute capability 7.5+ (found %s).",
+                    ".".join(map(str, capability)),
+                )
+        self.logger.info("PaddleOCR quantised recogniser from %s (precision=%s).", model_dir, precision)
+        return options
+
     def _initialise_extra_engines(self) -> None:
         """Initialize any additional engines defined in config (e.g. Surya)."""
         surya_conf = self.engine_configs.get("surya", {})
@@ -526,14 +985,26 @@ class OCRManager:
             self.logger.warning("Automatic PP-OCRv4 model setup failed: %s", exc)
 
     def _initialise_easy(self) -> None:
-        if not self._easy_enabled or easyocr is None:
+        if not self._easy_enabled:
             return
         if self.primary_engine != "easyocr" and self.secondary_engine != "easyocr":
             return
+        easyocr = _optional_import("easyocr")
+        if easyocr is None:
+            return
         try:
             # easyocr.Reader doesn't always support gpu_id in all versions.
             # It uses the current torch device.
-            self._easy_reader = easyocr.Reader(self._easy_langs, gpu=self._easy_use_gpu)  # type: ignore[arg-type]
+            try:
+                # cudnn_benchmark lets cuDNN keep the fastest kernels per input
+                # shape; _run_easy pads pages so those shapes repeat.
+                self._easy_reader = easyocr.Reader(  # type: ignore[arg-type]
+                    self._easy_langs, gpu=self._easy_use_gpu, cudnn_benchmark=self._easy_use_gpu
+                )
+            except TypeError:  # older EasyOCR without cudnn_benchmark
+                self._easy_reader = easyocr.Reader(self._easy_langs, gpu=self._easy_use_gpu)  # type: ignore[arg-type]
+            if self._easy_backend == "onnxruntime":
+                self._attach_easy_onnx()
             self.logger.info(
                 "EasyOCR initialised (langs=%s, gpu=%s).",
                 ",".join(self._easy_langs),
@@ -545,9 +1016,61 @@ class OCRManager:
             self.logger.warning("Failed to initialise EasyOCR: %s", exc)
             self._easy_reader = None
 
+    def _warm_up_engines(self) -> None:
+        """
+        Run each loaded engine once on a small synthetic text line.
+
+        The first inference pays lazy allocation, cuDNN autotuning and
+        ONNX Runtime/TensorRT kernel selection; doing it here keeps that off
+        the first document.  Batched engines are warmed with their batch size
+        so the batch kernels are the ones selected.  Disable per engine with
+        ``engine_configs.<engine>.warmup: false``.
+        """
+        warmups: List[Tuple[str, Callable[[np.ndarray], Any]]] = []
+        if self._paddle_ocr and self._paddle_warmup:
+            if self.primary_engine == "paddleocr":
+                warmups.append(("PaddleOCR", lambda page: self._run_paddle_batch([page] * self._paddle_batch_size)))
+            else:
+                warmups.append(("PaddleOCR", self._run_paddle))
+        if self._easy_reader and self._easy_warmup:
+            warmups.append(("EasyOCR", lambda page: self._run_easy_batch([page] * self._easy_batch_size)))
+        if not warmups:
+            return
+
+        canvas = Image.new("RGB", (256, 64), "white")
+        ImageDraw.Draw(canvas).text((8, 24), "AutOCR warm-up 0123", fill="black")
+        dummy = _pil_rgb_view(canvas)
+        for name, warm in warmups:
+            start = time.perf_counter()
+            try:
+                warm(dummy)
+            except Exception as exc:  # pragma: no cover - engine runtime errors
+                self.logger.debug("%s warm-up failed: %s", name, exc)
+                continue
+            self.logger.info("%s warmed up in %.2fs.", name, time.perf_counter() - start)
+
+    def _attach_easy_onnx(self) -> None:
+        """Swap the EasyOCR networks for ONNX Runtime sessions; keep PyTorch on failure."""
+        try:
+            from .easyocr_onnx import attach_onnx_backend
+
+            attach_onnx_backend(
+                self._easy_reader,
+                onnx_dir=self._easy_onnx_dir,
+                device_id=self.gpu_id,
+                tensorrt=self._easy_tensorrt and self._easy_use_gpu,
+                # INT8 only pays off on CPU; GPUs keep FP32/FP16 kernels.
+                int8=self._easy_precision == "int8" and not self._easy_use_gpu,
+                calibration_dir=str(self._easy_calibration_dir) if self._easy_calibration_dir else None,
+            )
+            self.logger.info("EasyOCR using ONNX Runtime models from %s.", self._easy_onnx_dir)
+        except Exception as exc:  # pragma: no cover - ONNX export/runtime errors
+            self.logger.warning("EasyOCR ONNX backend unavailable (%s); using PyTorch.", exc)
+
     def _determine_paddle_gpu(self, requested: bool) -> bool:
         has_cuda = False
         gpu_count = 0
+        paddle = _optional_import("paddle")
         if paddle is not None:
             try:
                 has_cuda = bool(paddle.device.is_compiled_with_cuda())
@@ -571,6 +1094,7 @@ class OCRManager:
     def _determine_easy_gpu(self, requested: bool) -> bool:
         if not requested:
             return False
+        torch = _optional_import("torch")
         if torch is None:
             self.logger.info("PyTorch not installed with CUDA support; EasyOCR will run on CPU.")
             return False
@@ -584,10 +1108,21 @@ class OCRManager:
         self.logger.info("CUDA not available; EasyOCR will run on CPU.")
         return False
 
-    @staticmethod
-    def _pil_to_np(image: Image.Image) -> np.ndarray:
-        array = np.array(image.convert("RGB"))
-        return array[:, :, ::-1]
+    def _pil_to_np(self, image: _PageImage) -> np.ndarray:
+        """
+        Return ``image`` as a contiguous BGR array.
+
+        The RGB buffer is exported once (:func:`_pil_rgb_view`) and cvtColor
+        swaps the channels straight into a per-thread scratch buffer, which is only
+        reallocated when the page size changes.  The result is overwritten by
+        the next call on the same thread.
+        """
+        array = _pil_rgb_view(image)
+        out = getattr(self._scratch, "bgr", None)
+        if out is None or out.shape != array.shape:
+            out = np.empty_like(array)
+            self._scratch.bgr = out
+        return cv2.cvtColor(array, cv2.COLOR_RGB2BGR, dst=out)
 
     @staticmethod
     def _crop(image: Image.Image, bbox: Sequence[int]) -> Optional[Image.Image]:
@@ -604,17 +1139,26 @@ class OCRManager:
             return None
         return image.crop((left, top, right, bottom))
 
-    def _load_document_images(self, path: str) -> List[Image.Image]:
+    def _load_document_images(self, path: str) -> Iterator[Image.Image]:
+        """
+        Yield the pages of ``path`` as RGB images.
+
+        PDFs are rasterised by pdftocairo with one worker per core, in chunks
+        of ``_PDF_CHUNK_PAGES`` pages (``_PDF_FIRST_CHUNK_PAGES`` for the
+        first) so peak memory stays bounded and the caller can start on the
+        first pages while later ones render.
+        """
         print(f"DEBUG: _load_document_images called for {path}")
         suffix = Path(path).suffix.lower()
         if suffix == ".pdf":
-            if convert_from_path is None:
+            pdf2image = _optional_import("pdf2image")
+            if pdf2image is None:
                 raise RuntimeError(
                     "pdf2image is required for PDF OCR but is not installed"
                 )
             
             # Use poppler_path if provided in config
-            kwargs = {}
+            kwargs: Dict[str, Any] = {}
             if self.poppler_path:
                 print(f"DEBUG: Using poppler_path: {self.poppler_path}")
                 self.logger.info(f"PDF OCR: Using poppler_path: {self.poppler_path}")
@@ -630,7 +1174,6 @@ class OCRManager:
                     
                     # Fix for Windows: Ensure poppler bin is in PATH for DLL loading
                     if os.name == 'nt':
-                        import os
                         current_path = os.environ.get("PATH", "")
                         if self.poppler_path not in current_path:
                             os.environ["PATH"] = self.poppler_path + os.pathsep + current_path
@@ -638,24 +1181,147 @@ class OCRManager:
                     self.logger.error(f"PDF OCR: pdfinfo.exe NOT FOUND at {pdfinfo_path}")
             else:
                 self.logger.warning("PDF OCR: No poppler_path provided in config")
-                
-            pages = convert_from_path(path, **kwargs)
-            return [page.convert("RGB") for page in pages]
 
+            page_count = 0
+            try:
+                page_count = int(pdf2image.pdfinfo_from_path(path, **kwargs).get("Pages", 0))
+            except Exception as exc:
+                self.logger.warning("pdfinfo failed for %s (%s); rasterising in one pass.", path, exc)
+            # Pages are rendered to JPEG files and decoded one at a time, so
+            # only the pages in flight are held in memory, not whole chunks.
+            with tempfile.TemporaryDirectory(prefix="autocr-pages-") as output_folder:
+                raster_kwargs = dict(
+                    kwargs,
+                    fmt="jpeg",
+                    jpegopt={"quality": 90},
+                    use_pdftocairo=True,
+                    output_folder=output_folder,
+                    paths_only=True,
+                )
+                if page_count <= 0:
+                    page_paths = pdf2image.convert_from_path(
+                        path, thread_count=os.cpu_count() or 1, **raster_kwargs
+                    )
+                    yield from self._load_rendered_pages(page_paths)
+                    return
+
+                first = 1
+                chunk = _PDF_FIRST_CHUNK_PAGES
+                while first <= page_count:
+                    last = min(first + chunk - 1, page_count)
+                    page_paths = pdf2image.convert_from_path(
+                        path,
+                        first_page=first,
+                        last_page=last,
+                        thread_count=min(os.cpu_count() or 1, last - first + 1),
+                        **raster_kwargs,
+                    )
+                    yield from self._load_rendered_pages(page_paths)
+                    first, chunk = last + 1, _PDF_CHUNK_PAGES
+            return
+
+        # Frames are decoded one at a time as the caller consumes them, so a
+        # long multi-page TIFF never sits in memory in full.
         with Image.open(path) as img:
-            frames: List[Image.Image] = []
             n_frames = getattr(img, "n_frames", 1)
+            yielded = False
             for frame in range(n_frames):
                 try:
                     img.seek(frame)
                 except EOFError:
                     break
-                frames.append(img.convert("RGB"))
-            return [frame.copy() for frame in frames] or [img.convert("RGB")]
+                yielded = True
+                yield img.convert("RGB")
+            if not yielded:
+                yield img.convert("RGB")
 
-    def _preprocess_image(self, pil_image: Image.Image) -> Image.Image:
+    @staticmethod
+    def _load_rendered_pages(page_paths: Iterable[str]) -> Iterator[Image.Image]:
+        """Decode pages rendered by pdf2image, deleting each file once loaded."""
+        for page_path in page_paths:
+            with Image.open(page_path) as page:
+                image = page.convert("RGB")
+            os.remove(page_path)
+            yield image
+
+    def _preprocess_image(self, pil_image: Image.Image, features: Optional[PageFeatures] = None) -> np.ndarray:
         """
-        Enhance image for OCR: upscale (if small), denoise, and sharpen.
+        Preprocessed page as a read-only RGB array (see :meth:`_preprocess_page`).
+
+        The engines take the array directly, so the page is not round-tripped
+        through PIL between preprocessing and recognition.
+
+        With ``preprocessing.cache`` enabled, results are keyed by the page
+        pixels plus the preprocessing config and kept as ``.npy`` files under
+        ``preprocessing.cache_dir`` (memory-mapped on reuse), with an
+        in-process LRU of ``_PREP_CACHE_SIZE`` pages on top, so re-OCRing a
+        document (another engine, another threshold) skips preprocessing.
+        """
+        if self._prep_cache_dir is None:
+            processed = self._preprocess_page(pil_image, features)
+            return processed if processed is not None else _pil_rgb_view(pil_image)
+        key = self._prep_cache_key(pil_image)
+        with self._prep_cache_lock:
+            cached = self._prep_cache.get(key)
+            if cached is not None:
+                self._prep_cache.move_to_end(key)
+                return cached
+        path = self._prep_cache_dir / f"{key}.npy"
+        if path.exists():
+            try:
+                cached = np.load(path, mmap_mode="r")
+            except (OSError, ValueError) as exc:
+                self.logger.debug("Discarding unreadable preprocessing cache %s: %s", path, exc)
+                cached = None
+
+        if cached is None:
+            cached = self._preprocess_page(pil_image, features)
+            if cached is None:  # preprocessing failed; do not cache the fallback
+                return _pil_rgb_view(pil_image)
+            self._prep_cache_store(path, cached)
+
+        with self._prep_cache_lock:
+            self._prep_cache[key] = cached
+            if len(self._prep_cache) > _PREP_CACHE_SIZE:
+                self._prep_cache.popitem(last=False)
+        return cached
+
+    def _prep_cache_key(self, pil_image: Image.Image) -> str:
+        src = _pil_rgb_view(pil_image)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.asarray(src.shape, dtype=np.int64).tobytes())
+        digest.update(src)
+        digest.update(self._prep_conf_key)
+        return digest.hexdigest()
+
+    def _prep_cache_store(self, path: Path, array: np.ndarray) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file.
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with tmp_path.open("wb") as handle:
+                np.save(handle, array)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            self.logger.debug("Could not write preprocessing cache %s: %s", path, exc)
+
+    def _preprocess_page(self, pil_image: Image.Image, features: Optional[PageFeatures] = None) -> Optional[np.ndarray]:
+        """
+        Enhance image for OCR: upscale (if small) and deskew, denoise, and sharpen.
+        Returns the RGB page array, or ``None`` if preprocessing failed.
+
+        Upscaling and deskewing are composed into one affine transform so the
+        page is interpolated once, and the unsharp mask is applied in place.
+        Denoising (``preprocessing.denoise_mode``, alias ``denoiser``: ``auto``,
+        ``bilateral``, ``median``, ``nlmeans`` or ``off``/``none``) is skipped
+        for likely handwritten pages, where the filter mostly erodes thin pen
+        strokes; ``auto`` filters only pages whose noise estimate reaches
+        ``preprocessing.denoise_threshold``.  ``features``
+        (from :meth:`_compute_page_features`) supplies the grayscale page, skew
+        and handwriting score so they are not recomputed here.  With
+        ``preprocessing.opencl`` the page is uploaded once as a ``cv2.UMat``
+        and only downloaded after sharpening, so those stages run on any
+        OpenCL device (integrated GPUs included).
         """
         try:
             # 0. Phase 9: Auto-Enhancement
@@ -669,48 +1335,146 @@ class OCRManager:
                     apply_clahe=bool(pre_conf.get("apply_clahe", False))
                 )
 
-            # Convert PIL to BGR (OpenCV format)
-            img_np = np.array(pil_image.convert("RGB"))[:, :, ::-1].copy()
-
-            # 1. Upscale if too small (width < 1500px)
-            height, width = img_np.shape[:2]
-            if width < 1500:
-                scale = 1500 / width
-                img_np = cv2.resize(img_np, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
-            
-            # 2. Denoise (Centralized)
-            img_np = denoise_image(img_np)
-
-            # 3. Sharpening (Unsharp Masking style)
-            gaussian = cv2.GaussianBlur(img_np, (0, 0), 3.0)
-            img_np = cv2.addWeighted(img_np, 1.5, gaussian, -0.5, 0)
-            
-            # 4. Deskew (Centralized)
-            img_np, angle = deskew_image(img_np)
+            # Every stage below is channel-order agnostic, so the page stays RGB.
+            src = _pil_rgb_view(pil_image)
+            if features is None:
+                gray = cv2.cvtColor(src, cv2.COLOR_RGB2GRAY)
+                angle, handwriting_prob = self._skew_angle(gray), 0.0
+            else:
+                gray, angle, handwriting_prob = features.gray_full, features.skew_angle, features.hw_prob
+
+            height, width = src.shape[:2]
+            if not angle and width >= 1500 and self._looks_clean(gray, features):
+                self.logger.debug("Preprocessing skipped: page is clean")
+                return src
+
+            # 1. Upscale if too small (width < 1500px) + deskew, in a single warp
+            if self._prep_opencl:
+                src = cv2.UMat(src)
+            scale = 1500 / width if width < 1500 else 1.0
+            if scale != 1.0 or angle:
+                out_w, out_h = int(round(width * scale)), int(round(height * scale))
+                matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, scale)
+                # Keep the rotated page centred in the upscaled frame.
+                matrix[0, 2] += out_w / 2 - width / 2
+                matrix[1, 2] += out_h / 2 - height / 2
+                # Bilinear by default: the recognisers are trained on bilinear
+                # resizes and cubic costs 2-3x more for no accuracy gain here.
+                interp = _WARP_INTERPOLATION.get(str(pre_conf.get("interp", "linear")).lower(), cv2.INTER_LINEAR)
+                img_np = cv2.warpAffine(
+                    src, matrix, (out_w, out_h), flags=interp, borderMode=cv2.BORDER_REPLICATE
+                )
+            else:
+                img_np = src if self._prep_opencl else src.copy()
             if abs(angle) > 0.5:
                 self.logger.info(f"📐 Fixed skew: {angle:.2f}°")
 
-            # Convert back to PIL RGB
-            return Image.fromarray(img_np[:, :, ::-1])
+            # 2. Denoise (Centralized)
+            denoise_mode = str(pre_conf.get("denoise_mode", pre_conf.get("denoiser", "auto"))).lower()
+            if handwriting_prob <= 0.5 and denoise_mode not in ("off", "none"):
+                if denoise_mode == "auto":
+                    # Clean pages skip the filter entirely.
+                    threshold = float(pre_conf.get("denoise_threshold", _DENOISE_MIN_NOISE))
+                    if estimate_noise(gray) >= threshold:
+                        img_np = denoise_image(img_np)
+                else:
+                    img_np = denoise_image(
+                        img_np,
+                        _DENOISE_STRENGTHS.get(denoise_mode, "normal"),
+                        color=bool(pre_conf.get("denoise_color", False)),
+                    )
+
+            # 3. Sharpening (Unsharp Masking style), in place
+            if self._prep_opencl:
+                blur_mat = cv2.GaussianBlur(img_np, (0, 0), 3.0)
+                return cv2.addWeighted(img_np, 1.5, blur_mat, -0.5, 0).get()
+            blur = getattr(self._scratch, "blur", None)
+            if blur is None or blur.shape != img_np.shape:
+                blur = np.empty_like(img_np)
+                self._scratch.blur = blur
+            cv2.GaussianBlur(img_np, (0, 0), 3.0, dst=blur)
+            cv2.addWeighted(img_np, 1.5, blur, -0.5, 0, dst=img_np)
+
+            return img_np
         except Exception as e:
             self.logger.warning(f"Image preprocessing failed, using original: {e}")
-            return pil_image
+            return None
+
+    def _looks_clean(self, gray: np.ndarray, features: Optional[PageFeatures] = None) -> bool:
+        """
+        Whether a straight, full-size page is crisp and noise-free (typically a
+        born-digital PDF), so upscaling, denoising and sharpening would only
+        no-op or slightly blur it.
+
+        Sharpness is the Laplacian variance of a small thumbnail, at least
+        ``preprocessing.skip_if_sharp`` (``null`` disables the check); noise
+        must stay below ``denoise_threshold``, since grain inflates the
+        variance too.
+        """
+        pre_conf = self.config.preprocessing
+        sharp_min = pre_conf.get("skip_if_sharp", _SHARP_MIN_LAPLACIAN_VAR)
+        if sharp_min is None:
+            return False
+        thumb = _downsample(gray if features is None else features.gray_small, _SHARP_PROBE_SIDE)
+        if cv2.Laplacian(thumb, cv2.CV_64F).var() < float(sharp_min):
+            return False
+        return estimate_noise(gray) < float(pre_conf.get("denoise_threshold", _DENOISE_MIN_NOISE))
+
+    def _skew_angle(self, gray: np.ndarray, gray_small: Optional[np.ndarray] = None) -> float:
+        """
+        Skew of ``gray`` in degrees, ``0.0`` for pages that are already aligned.
+
+        A cheap row-projection probe recognises aligned pages (most born-digital
+        PDFs) before the full estimate runs, and results are memoised per page
+        content.
+        """
+        key = (xxhash.xxh3_64(gray).digest() if xxhash is not None
+               else hashlib.blake2b(gray, digest_size=8).digest())
+        with self._skew_cache_lock:
+            if key in self._skew_cache:
+                self._skew_cache.move_to_end(key)
+                return self._skew_cache[key]
+
+        small = _downsample(gray if gray_small is None else gray_small, _ALIGNED_PROBE_SIDE)
+        row_ink = (255 - small.astype(np.float32)).sum(axis=1)
+        row_ink = row_ink[row_ink > 0]
+        if row_ink.size and row_ink.std() > _ALIGNED_ROW_CV * row_ink.mean():
+            angle = 0.0
+        else:
+            angle = estimate_skew_angle(gray)
 
+        with self._skew_cache_lock:
+            self._skew_cache[key] = angle
+            if len(self._skew_cache) > _SKEW_CACHE_SIZE:
+                self._skew_cache.popitem(last=False)
+        return angle
 
-    def _analyze_image_content(self, pil_image: Image.Image) -> str:
+    def _analyze_image_content(self, pil_image: _PageImage) -> str:
         """
         Analyze image to determine content type (table, text, noise).
         Returns: 'table', 'text', or 'noise'
+
+        Table rules show up as sharp peaks in the row/column sums of the
+        vertical/horizontal Sobel gradients; counting those on a downsampled
+        copy is much cheaper than a Hough transform over the full page.
         """
         try:
-            img_np = np.array(pil_image.convert("RGB"))
-            gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY)
-            
+            gray = cv2.cvtColor(_pil_rgb_view(pil_image), cv2.COLOR_RGB2GRAY)
+            return self._classify_content(_downsample(gray, _ROUTING_MAX_SIDE))
+        except Exception as e:
+            self.logger.warning(f"Content analysis failed: {e}")
+            return "text"
+
+    def _classify_content(self, gray: np.ndarray) -> str:
+        """:meth:`_analyze_image_content` on an already downsampled grayscale page."""
+        try:
             # 1. Detect Lines (Tables)
-            edges = cv2.Canny(gray, 50, 150, apertureSize=3)
-            lines = cv2.HoughLinesP(edges, 1, np.pi/180, 100, minLineLength=100, maxLineGap=10)
-            
-            if lines is not None and len(lines) > 5:
+            grad_x = cv2.Sobel(gray, cv2.CV_16S, 1, 0, ksize=3)
+            grad_y = cv2.Sobel(gray, cv2.CV_16S, 0, 1, ksize=3)
+            row_profile = np.abs(grad_y, dtype=np.float32).sum(axis=1)
+            col_profile = np.abs(grad_x, dtype=np.float32).sum(axis=0)
+
+            if _count_peaks(row_profile) >= _TABLE_MIN_ROWS and _count_peaks(col_profile) >= _TABLE_MIN_COLS:
                 # If we see substantial horizontal/vertical lines, it's likely a table/form
                 return "table"
                 
@@ -720,8 +1484,74 @@ class OCRManager:
             return "text"
 
 
+def _looks_blank(features: PageFeatures) -> bool:
+    """Near-white page with no handwriting signal (nothing for a second engine to find)."""
+    return features.hw_prob < _BLANK_MAX_HW_PROB and float(features.gray_small.mean()) > _BLANK_MIN_MEAN
+
+
+def _pil_rgb_view(image: _PageImage) -> np.ndarray:
+    """
+    Read-only ``(H, W, 3)`` uint8 array of ``image`` in RGB order.
+
+    Pages that are already RGB (all loader output) skip ``convert`` and are
+    exported by a single buffer copy; preprocessed page arrays are returned
+    as they are.  Callers must not write to the result.
+    """
+    if isinstance(image, np.ndarray):
+        return image
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return np.asarray(image, dtype=np.uint8)
+
+
+def _join_lines(pairs: Sequence[Tuple[str, float]]) -> Tuple[str, float]:
+    """Join ``(text, confidence)`` lines into page text and mean confidence."""
+    if not pairs:
+        return "", 0.0
+    texts, confidences = zip(*pairs)
+    return "\n".join(texts), float(np.fromiter(confidences, dtype=np.float64, count=len(pairs)).mean())
+
+
+def _downsample(gray: np.ndarray, max_side: int) -> np.ndarray:
+    """Shrink ``gray`` (INTER_AREA) so its long edge is at most ``max_side``."""
+    scale = max_side / float(max(gray.shape[:2]))
+    if scale >= 1.0:
+        return gray
+    return cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+
+def _round_up(value: int, multiple: int) -> int:
+    return -(-value // multiple) * multiple
+
+
+def _pad_to_multiple(array: np.ndarray, multiple: int) -> np.ndarray:
+    """Pad ``array`` with white on the bottom/right up to a multiple of ``multiple``."""
+    height, width = array.shape[:2]
+    return _pad_to_shape(array, _round_up(height, multiple), _round_up(width, multiple))
+
+
+def _pad_to_shape(array: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Pad ``array`` with white on the bottom/right up to ``height`` x ``width``."""
+    pad_h = height - array.shape[0]
+    pad_w = width - array.shape[1]
+    if not pad_h and not pad_w:
+        return array
+    return cv2.copyMakeBorder(array, 0, pad_h, 0, pad_w, cv2.BORDER_CONSTANT, value=(255, 255, 255))
+
+
+def _count_peaks(profile: np.ndarray, n_std: float = 3.0) -> int:
+    """Count local maxima of ``profile`` rising above ``mean + n_std * std``."""
+    if profile.size < 3:
+        return 0
+    threshold = profile.mean() + n_std * profile.std()
+    centre = profile[1:-1]
+    peaks = (centre > threshold) & (centre >= profile[:-2]) & (centre > profile[2:])
+    return int(np.count_nonzero(peaks))
+
+
 def _normalise_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() collapses the same (Unicode) whitespace as \s+ without a regex pass.
+    return " ".join(text.split())
 
 
 def _looks_like_heading(line: str) -> bool:
@@ -729,7 +1559,8 @@ def _looks_like_heading(line: str) -> bool:
         return False
     if len(line) < 100 and (line.isupper() or line.endswith(":")):
         return True
-    if len(line.split()) <= 6 and line == line.title():
+    # Bounded split: only need to know whether there are more than six words.
+    if len(line.split(None, 6)) <= 6 and line == line.title():
         return True
     return False
 
@@ -0,0 +1,168 @@
+"""
+Stand-alone OCR microservice with cross-request batching.
+
+The service keeps one :class:`~modules.ocr_cascade.MultiOCR` (and therefore
+one copy of every model) for its whole lifetime.  Incoming ``POST /ocr``
+uploads are queued and grouped into batches of up to ``max_batch_size`` or
+whatever arrived within ``max_wait_time`` seconds, then run through
+:meth:`MultiOCR.run_batch`, so EasyOCR sees size-bucketed batches built from
+many callers instead of one image per request.
+
+Run with ``python -m modules.ocr_service`` (``OCR_SERVICE_HOST`` /
+``OCR_SERVICE_PORT``) and point clients at it with ``OCR_SERVICE_URL``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from .ocr_cascade import MultiOCR
+
+try:  # pragma: no cover - optional dependency
+    from fastapi import FastAPI, File, HTTPException, UploadFile
+except ImportError:  # pragma: no cover - optional dependency
+    FastAPI = None  # type: ignore[assignment]
+
+
+@dataclass
+class _BatchItem:
+    path: str
+    future: asyncio.Future = field(repr=False)
+
+
+class AsyncBatchQueue:
+    """
+    Collect single-image requests into batches for :meth:`MultiOCR.run_batch`.
+
+    A batch is dispatched as soon as ``max_batch_size`` items are waiting or
+    ``max_wait_time`` seconds have passed since its first item arrived.
+    Engine work runs in a worker thread so the event loop keeps accepting
+    requests while a batch is being processed.
+    """
+
+    def __init__(self, ocr: MultiOCR, max_batch_size: int = 16, max_wait_time: float = 0.05) -> None:
+        self.ocr = ocr
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_time = max_wait_time
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, path: str) -> List[Dict[str, Any]]:
+        """Queue ``path`` and wait for its OCR result."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_BatchItem(path, future))  # type: ignore[union-attr]
+        return await future
+
+    async def _collect_batch(self) -> List[_BatchItem]:
+        queue = self._queue
+        batch = [await queue.get()]  # type: ignore[union-attr]
+        deadline = asyncio.get_running_loop().time() + self.max_wait_time
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))  # type: ignore[union-attr]
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            logger.debug("OCR service dispatching batch of {}", len(batch))
+            try:
+                results = await asyncio.to_thread(self.ocr.run_batch, [item.path for item in batch])
+            except Exception as exc:  # pragma: no cover - engine runtime errors
+                logger.error("❌ OCR batch failed: {}", exc)
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(exc)
+                continue
+            for item, result in zip(batch, results):
+                if not item.future.done():
+                    item.future.set_result(result)
+
+
+def create_app(
+    langs: Sequence[str] | None = None,
+    max_batch_size: int = 16,
+    max_wait_time: float = 0.05,
+) -> Any:
+    """Build the FastAPI application holding the OCR engines."""
+    if FastAPI is None:
+        raise ImportError("fastapi is required for the OCR service.")
+
+    app = FastAPI(title="AutOCR OCR service")
+    state: Dict[str, AsyncBatchQueue] = {}
+
+    @app.on_event("startup")
+    async def _startup() -> None:
+        ocr = await asyncio.to_thread(MultiOCR, langs)
+        state["queue"] = AsyncBatchQueue(ocr, max_batch_size=max_batch_size, max_wait_time=max_wait_time)
+        state["queue"].start()
+        logger.info("✅ OCR service ready.")
+
+    @app.on_event("shutdown")
+    async def _shutdown() -> None:
+        if "queue" in state:
+            await state["queue"].stop()
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {"ready": "queue" in state}
+
+    @app.post("/ocr")
+    async def ocr(file: UploadFile = File(...)) -> List[Dict[str, Any]]:
+        if "queue" not in state:
+            raise HTTPException(status_code=503, detail="OCR engines are still loading.")
+        suffix = os.path.splitext(file.filename or "")[1] or ".png"
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as handle:
+            handle.write(await file.read())
+            path = handle.name
+        try:
+            return await state["queue"].submit(path)
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    host = os.getenv("OCR_SERVICE_HOST", "0.0.0.0")
+    port = int(os.getenv("OCR_SERVICE_PORT", "8100"))
+    logger.info("🌐 OCR service listening on {}:{}", host, port)
+    uvicorn.run(create_app(), host=host, port=port, workers=1)
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["AsyncBatchQueue", "create_app"]
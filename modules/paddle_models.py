@@ -2,7 +2,9 @@
 
 This module centralises download/extraction of PP-OCRv4 inference models so
 runtime components can request model directories without embedding brittle
-scripts elsewhere in the codebase.
+scripts elsewhere in the codebase.  It also opens ONNX exports of those models
+(``paddle2onnx``, or EasyOCR's via :mod:`modules.easyocr_onnx`) with ONNX
+Runtime, pinning the CUDA/TensorRT providers explicitly.
 """
 
 from __future__ import annotations
@@ -10,12 +12,19 @@ from __future__ import annotations
 import os
 import tarfile
 import tempfile
+import threading
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Tuple, Union
 
 from loguru import logger
 
+try:  # pragma: no cover - optional dependency
+    import onnxruntime as ort
+except ImportError:  # pragma: no cover - optional dependency
+    ort = None
+
 
 # URLs published by PaddleOCR for PP-OCRv4 multilingual (Latin) models compatible with Paddle 3.0.0
 PP_OCRV4_SPECS = {
@@ -36,6 +45,11 @@ PP_OCRV4_SPECS = {
 }
 
 
+# One lock per archive URL so concurrent callers never fetch or extract the same tarball twice.
+_DOWNLOAD_LOCKS: Dict[str, threading.Lock] = {}
+_DOWNLOAD_LOCKS_GUARD = threading.Lock()
+
+
 def ensure_ppocrv4_models(base_dir: str, profile: str = "latin") -> Dict[str, str]:
     """Download (if necessary) and return PP-OCRv4 model directories.
 
@@ -63,15 +77,77 @@ def ensure_ppocrv4_models(base_dir: str, profile: str = "latin") -> Dict[str, st
     variant_root.mkdir(parents=True, exist_ok=True)
 
     specs = PP_OCRV4_SPECS[profile_key]
-    model_dirs: Dict[str, str] = {}
-
-    for key, spec in specs.items():
-        folder = variant_root / spec["folder"]
+    missing = [spec for spec in specs.values() if not _model_ready(variant_root / spec["folder"])]
+
+    # The archives are independent, so they are fetched concurrently and the
+    # wait is roughly the slowest download rather than the sum of all three.
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing), thread_name_prefix="paddle-download") as pool:
+            futures = [
+                pool.submit(_ensure_model, spec["url"], variant_root / spec["folder"], variant_root)
+                for spec in missing
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    return {f"{key}_model_dir": str(variant_root / spec["folder"]) for key, spec in specs.items()}
+
+
+def _ensure_model(url: str, folder: Path, target_dir: Path) -> None:
+    with _DOWNLOAD_LOCKS_GUARD:
+        lock = _DOWNLOAD_LOCKS.setdefault(url, threading.Lock())
+    with lock:
+        # Another caller may have finished this model while we waited.
         if not _model_ready(folder):
-            _download_and_extract(spec["url"], variant_root)
-        model_dirs[f"{key}_model_dir"] = str(folder)
+            _download_and_extract(url, target_dir)
+
+
+def onnx_providers(
+    device_id: int = 0,
+    tensorrt: bool = False,
+    trt_cache_dir: str = os.path.join("models", "trt_cache"),
+    conv_algo_search: str = "EXHAUSTIVE",
+) -> List[Union[str, Tuple[str, Dict[str, Any]]]]:
+    """Execution providers in ONNX Runtime's tuple form: CUDA first, CPU as fallback.
+
+    With ``tensorrt`` the TensorRT provider (FP16, engines cached in
+    ``trt_cache_dir`` so they are only built once) is tried before CUDA.
+    ``conv_algo_search`` is cuDNN's convolution algorithm search
+    (``EXHAUSTIVE``, ``HEURISTIC`` or ``DEFAULT``).  The exhaustive search
+    benchmarks every algorithm once per new input shape, which pays off for
+    repeated shapes but stalls models fed many different ones.
+    """
+    providers: List[Union[str, Tuple[str, Dict[str, Any]]]] = [
+        ("CUDAExecutionProvider", {"device_id": device_id, "cudnn_conv_algo_search": conv_algo_search}),
+        "CPUExecutionProvider",
+    ]
+    if tensorrt:
+        providers.insert(0, ("TensorrtExecutionProvider", {
+            "device_id": device_id,
+            "trt_fp16_enable": True,
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": trt_cache_dir,
+        }))
+    return providers
+
+
+def create_onnx_session(
+    model_path: str, device_id: int = 0, tensorrt: bool = False, conv_algo_search: str = "EXHAUSTIVE"
+) -> Any:
+    """Open an ONNX-exported OCR model, preferring the GPU.
+
+    ONNX Runtime silently drops providers it cannot load, so the providers
+    actually in use are checked and a warning is logged on CPU fallback.
+    """
 
-    return model_dirs
+    if ort is None:
+        raise ImportError("onnxruntime is not installed.")
+    session = ort.InferenceSession(
+        model_path, providers=onnx_providers(device_id, tensorrt=tensorrt, conv_algo_search=conv_algo_search)
+    )
+    if not {"CUDAExecutionProvider", "TensorrtExecutionProvider"} & set(session.get_providers()):
+        logger.warning("⚠️ ONNX Runtime is running {} on CPU (providers: {})", model_path, session.get_providers())
+    return session
 
 
 def _model_ready(path: Path) -> bool:
@@ -128,4 +204,4 @@ def _is_within_directory(directory: Path, target: Path) -> bool:
         return False
 
 
-__all__ = ["ensure_ppocrv4_models"]
+__all__ = ["ensure_ppocrv4_models", "onnx_providers", "create_onnx_session"]
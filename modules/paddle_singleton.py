@@ -9,7 +9,7 @@ from __future__ import annotations
 import os
 import threading
 import sys
-from typing import Optional
+from typing import Any, Optional
 
 import traceback
 from loguru import logger
@@ -39,14 +39,23 @@ if os.name == "nt":
     except Exception:
         pass
 
+# Constructor options that select an accelerated backend; dropped when it cannot be built.
+_ACCELERATION_OPTIONS = ("enable_hpi", "hpi_config", "use_tensorrt", "precision")
+
 # Singleton state
 _pp_instance = None
 _pp_lock = threading.Lock()
+# Serialises inference on the shared instance: the predictor is not
+# thread-safe and every caller in the process gets the same one.
+inference_lock = threading.Lock()
 
-def get_ppstructure_v3_instance():
+def get_ppstructure_v3_instance(**kwargs: Any):
     """
     Return a process-wide PPStructureV3 instance.
     GPU is selected via paddle.set_device("gpu").
+    ``kwargs`` (e.g. ``enable_hpi``, ``precision``, ``cpu_threads``) are
+    forwarded to the constructor by whichever caller creates the instance
+    first; later calls share it unchanged.
     Returns None if initialization or dependency loading fails.
     """
     global _pp_instance
@@ -82,7 +91,25 @@ def get_ppstructure_v3_instance():
             # Clean initialization of PPStructureV3
             # No legacy hacks or artificial version detection
             logger.info("Initializing PPStructureV3 engine...")
-            _pp_instance = PPStructureV3()
+            if kwargs:
+                logger.info("PPStructureV3 options: {}", kwargs)
+                try:
+                    _pp_instance = PPStructureV3(**kwargs)
+                except TypeError as e:
+                    # Older PaddleOCR releases do not accept the acceleration options
+                    logger.warning("PPStructureV3 rejected options ({}); using defaults.", e)
+                    _pp_instance = PPStructureV3()
+                except Exception as e:
+                    if not (kwargs.get("enable_hpi") or kwargs.get("use_tensorrt")):
+                        raise
+                    # enable_hpi needs the HPI plugin and TensorRT a matching
+                    # TensorRT build; without them keep the plain Paddle Inference
+                    # backend rather than losing the engine altogether.
+                    logger.warning("PPStructureV3 acceleration unavailable ({}); using Paddle Inference.", e)
+                    fallback = {k: v for k, v in kwargs.items() if k not in _ACCELERATION_OPTIONS}
+                    _pp_instance = PPStructureV3(**fallback)
+            else:
+                _pp_instance = PPStructureV3()
             logger.info("PPStructureV3 engine loaded successfully.")
             
         except (ImportError, OSError) as e:
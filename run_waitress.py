@@ -7,9 +7,10 @@ import sys
 # ensure project root on path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules.logger_setup import logger
+from modules.logger_setup import init_loguru, logger
 
 def main() -> None:
+    init_loguru()
     # Import and initialise the Flask app
     try:
         from web_app.app import app, init_app
@@ -19,6 +20,8 @@ def main() -> None:
 
     try:
         init_app()
+        from web_app.services import get_db
+        init_loguru(db_manager=get_db())
     except Exception as exc:
         logger.exception("❌ Failed to initialise application: %s", exc)
         raise
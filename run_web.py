@@ -10,7 +10,7 @@ import sys
 # Ensure root path is in sys.path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules.logger_setup import logger
+from modules.logger_setup import init_loguru, logger
 from modules.startup_test import run_startup_test
 from modules.email_importer import EmailImporter
 
@@ -54,6 +54,7 @@ except ImportError:
 
 
 def main() -> None:
+    init_loguru()
     logger.info("🚀 Starting AutOCR_V2...")
 
     # --- Step 0: Setup PaddlePaddle device ---
@@ -83,6 +84,8 @@ def main() -> None:
         app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
         
         init_app()
+        from web_app.services import get_db
+        init_loguru(db_manager=get_db())
         logger.success("✅ Application initialised successfully.")
 
         # --- Start Email Importer (if enabled) ---
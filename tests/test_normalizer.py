@@ -0,0 +1,27 @@
+"""Tests for DataNormalizer batch normalisation."""
+
+import pandas as pd
+
+from modules.normalizer import DataNormalizer
+
+
+def test_normalize_batch_matches_per_document_rules():
+    df = pd.DataFrame({
+        "vendor": ["ACME S.L.", "Foo  Bar Ltd", None],
+        "total": ["12.3456", 7, "n/a"],
+        "date": ["2024-01-31", "31/01/2024", "2024-02-01"],
+    })
+    result = DataNormalizer().normalize_batch(df)
+    assert result["vendor"].tolist()[:2] == ["Acme", "Foo Bar"]
+    assert pd.isna(result["vendor"].iloc[2])
+    assert result["total"].tolist()[:2] == [12.35, 7.0]
+    assert pd.isna(result["total"].iloc[2])
+    assert result["currency"].tolist() == ["EUR"] * 3
+    assert df["vendor"].iloc[0] == "ACME S.L."
+
+
+def test_normalize_batch_keeps_currency_and_skips_missing_columns():
+    df = pd.DataFrame({"total": [1.0, 2.0], "currency": ["USD", None]})
+    result = DataNormalizer().normalize_batch(df)
+    assert result["currency"].tolist() == ["USD", "EUR"]
+    assert "vendor" not in result
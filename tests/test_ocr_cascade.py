@@ -0,0 +1,18 @@
+"""Tests for MultiOCR helpers."""
+
+from modules.ocr_cascade import MultiOCR
+
+
+def test_size_buckets_group_similar_pages():
+    buckets = MultiOCR._size_buckets({0: (2000, 1000), 1: (2100, 1100), 2: (2300, 1150)})
+    assert buckets == [((2300, 1150), [0, 1, 2])]
+
+
+def test_size_buckets_bound_width_from_below():
+    buckets = MultiOCR._size_buckets({0: (2000, 1000), 1: (400, 1100), 2: (2400, 1050)})
+    assert buckets == [((2400, 1050), [0, 2]), ((400, 1100), [1])]
+
+
+def test_size_buckets_split_distant_heights():
+    buckets = MultiOCR._size_buckets({0: (1000, 500), 1: (1000, 2000)})
+    assert buckets == [((1000, 500), [0]), ((1000, 2000), [1])]
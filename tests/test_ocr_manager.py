@@ -0,0 +1,105 @@
+"""Tests for OCRConfig normalisation and OCRManager page extraction."""
+
+import logging
+import threading
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from modules.ocr_manager import DEFAULT_LANGUAGES, OCRConfig, OCRManager, PageFeatures
+
+
+class DummyPaddle:
+    """Primary engine returning one queued ``(text, score)`` per page."""
+
+    def __init__(self, results):
+        self.results = list(results)
+
+    def predict(self, arrays):
+        return [
+            {"overall_ocr_res": {"rec_texts": [text] if text else [], "rec_scores": [score] if text else []}}
+            for text, score in (self.results.pop(0) for _ in arrays)
+        ]
+
+
+class DummyEasy:
+    """Secondary engine recording how many pages it was asked to read."""
+
+    def __init__(self):
+        self.pages = 0
+
+    def readtext(self, array, detail=1):
+        self.pages += 1
+        return [([0, 0], "secondary-result", 0.9)]
+
+    def readtext_batched(self, arrays, **kwargs):
+        return [self.readtext(array) for array in arrays]
+
+
+def _features(blank):
+    gray = np.full((8, 8), 255 if blank else 40, dtype=np.uint8)
+    return PageFeatures(gray_full=gray, gray_small=gray, hw_prob=0.0, skew_angle=0.0)
+
+
+def _manager(monkeypatch, pages):
+    """OCRManager with stub engines; ``pages`` is a list of ``(text, score, blank)``."""
+    manager = OCRManager.__new__(OCRManager)
+    manager.logger = logging.getLogger("test")
+    manager._scratch = threading.local()
+    manager.config = OCRConfig(min_confidence_primary=0.6, confidence_margin=0.05)
+    manager.primary_engine = "paddleocr"
+    manager.secondary_engine = "easyocr"
+    manager.extra_engines = {}
+    manager._paddle_ocr = DummyPaddle((text, score) for text, score, _blank in pages)
+    manager._easy_reader = DummyEasy()
+    manager._paddle_batch_size = 2
+    manager._easy_batch_size = 2
+
+    image = Image.new("RGB", (20, 20), "white")
+    prepared = [(image, _features(blank), np.asarray(image)) for _text, _score, blank in pages]
+    monkeypatch.setattr(manager, "_iter_prepared_pages", lambda file_path: iter(prepared))
+    return manager
+
+
+def test_near_threshold_page_skips_secondary(monkeypatch):
+    manager = _manager(monkeypatch, [("close", 0.57, False), ("weak", 0.3, False)])
+    pages = manager._extract_pages("doc.pdf")
+    assert manager._easy_reader.pages == 1
+    assert [page.text for page in pages] == ["close", "secondary-result"]
+
+
+def test_blank_page_skips_secondary(monkeypatch):
+    manager = _manager(monkeypatch, [("", 0.0, True), ("", 0.0, True), ("", 0.0, True)])
+    pages = manager._extract_pages("doc.pdf")
+    assert manager._easy_reader.pages == 0
+    assert [page.text for page in pages] == ["", "", ""]
+
+
+def test_empty_page_gets_one_secondary_call(monkeypatch):
+    manager = _manager(monkeypatch, [("", 0.0, False), ("primary-result", 0.9, False)])
+    pages = manager._extract_pages("doc.pdf")
+    assert manager._easy_reader.pages == 1
+    assert [page.text for page in pages] == ["secondary-result", "primary-result"]
+
+
+def test_config_normalises_fields():
+    config = OCRConfig(
+        languages=["es", "en"],
+        primary_engine="PaddleOCR",
+        secondary_engine="EasyOCR",
+        engine_configs={"PaddleOCR": {"batch_size": 4}},
+    )
+    assert config.languages == ("es", "en")
+    assert (config.primary_engine, config.secondary_engine) == ("paddleocr", "easyocr")
+    assert config.engine_configs["paddleocr"] == {"batch_size": 4}
+
+
+def test_config_is_read_only():
+    config = OCRConfig(languages=[], engine_configs=None, preprocessing={"enabled": True})
+    assert config.languages == DEFAULT_LANGUAGES
+    assert dict(config.engine_configs) == {}
+    with pytest.raises(TypeError):
+        config.preprocessing["enabled"] = False
+    with pytest.raises(AttributeError):
+        config.primary_engine = "easyocr"